@@ -13,7 +13,7 @@ import ctypes
 from typing import Optional, List, Dict, Any
 
 from .service import ScreenAssignService
-from .layout_manager import LayoutError
+from .layout_manager import LayoutError, write_layout_file
 
 # Setup logging with file output
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
@@ -138,17 +138,24 @@ def apply_rules():
       - layout_name (str): name of the layout to apply
       - assignment (dict): slot->identity_key mapping,
             e.g. {"1": "-1920_0_1080_1920", "2": "0_0_1920_1080"}
+
+    Optional body fields:
+      - only_if_changed (bool): skip the pass when windows, monitors, layout
+            and assignment are unchanged since the last one (periodic ticks)
     """
     data = request.json or {}
     layout_name = data.get("layout_name")
     assignment = data.get("assignment")
+    only_if_changed = bool(data.get("only_if_changed", False))
     if not layout_name:
         return jsonify({"error": "layout_name is required"}), 400
     if not assignment or not isinstance(assignment, dict):
         return jsonify({"error": "assignment is required (dict mapping slot numbers to identity keys x_y_W_H)"}), 400
     svc = _require_service()
     try:
-        results = svc.apply_rules_now(layout_name, assignment)
+        results = svc.apply_rules_now(
+            layout_name, assignment, only_if_changed=only_if_changed
+        )
         return jsonify(results)
     except LayoutError as e:
         return jsonify({"error": str(e)}), 409
@@ -156,15 +163,20 @@ def apply_rules():
 
 @screenassign_api.route("/monitors", methods=["GET"])
 def get_monitors():
-    """Get all known monitors with runtime DPI information."""
+    """Get all known monitors with runtime DPI information.
+
+    Pass refresh=true to force monitor re-detection instead of using the
+    result of a detect pass from the last few seconds.
+    """
     svc = _require_service()
-    svc.monitor_manager.detect_monitors()
+    force = request.args.get("refresh") == "true"
+    svc.monitor_manager.get_cached_connected_ids(force=force)
     if request.args.get("connected_only") == "true":
         # Return connected monitors with runtime DPI scale
         return jsonify(svc.monitor_manager.get_monitors_with_runtime_info())
     if request.args.get("with_status") == "true":
         # Return all monitors with connection status
-        return jsonify(svc.get_monitors_with_status())
+        return jsonify(svc.get_monitors_with_status(force=force))
     return jsonify(svc.get_monitors())
 
 
@@ -270,6 +282,38 @@ def focus_window_only():
         return jsonify({"error": str(e)}), 500
 
 
+@screenassign_api.route("/switcher-window", methods=["POST", "DELETE"])
+def register_switcher_window():
+    """Register a window switcher window so it is left out of the window list.
+
+    Matching by hwnd avoids querying the window at all; the title marker
+    check remains as a fallback for unregistered switcher windows. DELETE
+    unregisters the window again (sent by the switcher when it exits).
+
+    Payload:
+      - hwnd: number|string (required)
+    """
+    data = request.json or {}
+    hwnd_raw = data.get("hwnd")
+
+    if hwnd_raw is None:
+        return jsonify({"error": "hwnd is required"}), 400
+
+    try:
+        hwnd = int(hwnd_raw)
+    except Exception:
+        return jsonify({"error": "hwnd must be an integer"}), 400
+
+    try:
+        if request.method == "DELETE":
+            _require_service().unregister_switcher_window(hwnd)
+        else:
+            _require_service().register_switcher_window(hwnd)
+        return jsonify({"success": True})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @screenassign_api.route("/health", methods=["GET"])
 def health():
     """Basic health probe for WindowSwitcher and dashboards."""
@@ -943,8 +987,7 @@ def add_rule_to_layout(layout_name):
             message = f"Rule added to layout '{layout_name}'"
 
         # Save layout file
-        with open(layout_file, "w", encoding="utf-8") as f:
-            json.dump(layout_data, f, indent=2, ensure_ascii=False)
+        write_layout_file(layout_file, layout_data)
 
         api_logger.info(f"Added rule {rule_id} to layout {layout_name}")
 
@@ -994,8 +1037,7 @@ def delete_rule_from_layout(layout_name, rule_id):
             return jsonify({"error": f"Rule '{rule_id}' not found"}), 404
 
         # Save layout file
-        with open(layout_file, "w", encoding="utf-8") as f:
-            json.dump(layout_data, f, indent=2, ensure_ascii=False)
+        write_layout_file(layout_file, layout_data)
 
         api_logger.info(f"Deleted rule {rule_id} from layout {layout_name}")
 
@@ -1406,10 +1448,10 @@ def screen_assign_ui():
             }
             
             // Load monitors
-            async function loadMonitors() {
+            async function loadMonitors(refresh = false) {
                 showSection('monitors', true);
                 try {
-                    const response = await fetch('/monitors');
+                    const response = await fetch(refresh ? '/monitors?refresh=true' : '/monitors');
                     if (!response.ok) throw new Error('Network response was not ok');
                     
                     const statusResponse = await fetch('/status');
@@ -1728,7 +1770,7 @@ def screen_assign_ui():
                 });
                 
                 document.getElementById('refreshStatusBtn').addEventListener('click', loadStatus);
-                document.getElementById('refreshMonitorsBtn').addEventListener('click', loadMonitors);
+                document.getElementById('refreshMonitorsBtn').addEventListener('click', () => loadMonitors(true));
                 document.getElementById('refreshWindowsBtn').addEventListener('click', loadWindows);
                 
                 // Set up add rule modal
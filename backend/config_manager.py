@@ -154,13 +154,6 @@ class ConfigManager:
         if "id" not in monitor_data:
             monitor_data["id"] = f"monitor_{str(uuid.uuid4())[:8]}"
 
-        # Add timestamps if not provided.
-        # NOTE: We intentionally avoid updating any "last seen" style fields on every
-        # detect cycle to prevent noisy config writes.
-        now = datetime.now().isoformat()
-        if "first_detected" not in monitor_data:
-            monitor_data["first_detected"] = now
-
         # Check if a monitor with matching fingerprint already exists.
         # Use hierarchical matching: primary first, then secondary, then tertiary
         for existing_monitor in self.config["known_monitors"]:
@@ -200,7 +193,14 @@ class ConfigManager:
                 self.save_config()
                 return existing_monitor["id"]
 
-        # If no matching monitor is found, add the new one
+        # If no matching monitor is found, add the new one.
+        # The timestamp is only formatted here: matched monitors never persist it,
+        # so building it on every detect cycle was wasted work.
+        # NOTE: We intentionally avoid updating any "last seen" style fields on every
+        # detect cycle to prevent noisy config writes.
+        if "first_detected" not in monitor_data:
+            monitor_data["first_detected"] = datetime.now().isoformat()
+
         self.config["known_monitors"].append(monitor_data)
         self.save_config()
         self.logger.info(
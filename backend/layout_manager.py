@@ -12,8 +12,11 @@ The on-disk file is NOT rewritten by this module; use the migrate_layouts script
 for a permanent migration.
 """
 
+import functools
 import json
 import logging
+import os
+import sys
 import uuid
 from pathlib import Path
 from datetime import datetime
@@ -22,12 +25,18 @@ from typing import Dict, List, Optional, Tuple
 from .layout_matcher import LayoutMatcher, LayoutError  # noqa: F401  (re-export)
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_exe_name(exe_name: str) -> str:
-    """Normalize exe name for comparison (lowercase, ensure .exe suffix)."""
+    """Normalize exe name for comparison (lowercase, ensure .exe suffix).
+
+    Memoized: the same few hundred exe names are normalized over and over by
+    rule matching. Results are interned so dict/set lookups on them hit the
+    identity fast path.
+    """
     s = (exe_name or "").strip().lower()
-    if s.endswith(".exe"):
-        return s
-    return s + ".exe" if s else s
+    if not s.endswith(".exe") and s:
+        s += ".exe"
+    return sys.intern(s)
 
 
 def find_matching_rule_for_window(
@@ -44,31 +53,64 @@ def find_matching_rule_for_window(
     Returns:
         First matching rule dict, or None if no match
     """
+    # Window-side values do not depend on the rule; compute them once.
+    exe_norm = normalize_exe_name(
+        window_data.get("exe_name") or window_data.get("app_name") or ""
+    )
+    title_lower = (window_data.get("title") or "").lower()
+    path_lower = (window_data.get("process_path") or "").lower()
+
     for rule in rules:
         match_type = rule.get("match_type")
-        match_value = (rule.get("match_value") or "").strip()
-        match_value_lower = match_value.lower()
 
         if match_type == "exe":
-            exe_name = (
-                window_data.get("exe_name") or window_data.get("app_name") or ""
-            ).strip()
-            if normalize_exe_name(exe_name) == normalize_exe_name(match_value_lower):
+            # normalize_exe_name strips/lowercases itself and is memoized on
+            # the raw rule value, so this is a cache hit after the first window.
+            if exe_norm == normalize_exe_name(rule.get("match_value") or ""):
                 return rule
+            continue
 
-        elif match_type == "window_title":
-            title = (window_data.get("title") or "").lower()
-            if match_value_lower and match_value_lower in title:
+        match_value_lower = (rule.get("match_value") or "").strip().lower()
+
+        if match_type == "window_title":
+            if match_value_lower and match_value_lower in title_lower:
                 return rule
 
         elif match_type == "process_path":
-            process_path = (window_data.get("process_path") or "").lower()
-            if match_value_lower and match_value_lower == process_path:
+            if match_value_lower and match_value_lower == path_lower:
                 return rule
 
     return None
 
 
+def write_layout_file(file_path: Path, layout_data: Dict) -> None:
+    """Serialize a layout dict and write it to disk.
+
+    Layout files are meant to be hand-edited, so they stay pretty-printed.
+    The document is encoded in one json.dumps call and written with a single
+    write; json.dump would issue one small write per encoder chunk.
+
+    The write goes to a sibling temp file that is fsynced and then swapped in
+    with os.replace, so a crash mid-write never leaves a truncated layout that
+    list_layouts/load_layout would keep failing to parse.
+    """
+    payload = json.dumps(layout_data, indent=2, ensure_ascii=False).encode("utf-8")
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
 def _migrate_v1_to_v2(layout_data: Dict) -> Dict:
     """Return an in-memory v2 copy of a v1 layout dict.
 
@@ -113,6 +155,13 @@ class LayoutManager:
         self.layouts_dir = Path(layouts_dir)
         self.matcher = LayoutMatcher(monitor_manager)
 
+        # list_layouts summaries keyed by file path: ((mtime_ns, size), info)
+        self._layout_info_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+        # load_layout results keyed by file name: ((mtime_ns, size), layout_data)
+        self._loaded_layout_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+        # get_layout_preview static fields keyed by file name: (layout_data, preview)
+        self._layout_preview_cache: Dict[str, Tuple[Dict, Dict]] = {}
+
         if not self.layouts_dir.exists():
             self.layouts_dir.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"Created layouts directory: {self.layouts_dir}")
@@ -134,10 +183,23 @@ class LayoutManager:
             self.logger.warning(f"Layouts directory does not exist: {self.layouts_dir}")
             return layouts
 
+        seen = set()
         for layout_file in self.layouts_dir.glob("*.json"):
+            cache_key = str(layout_file)
+            seen.add(cache_key)
             try:
-                with open(layout_file, "r") as f:
-                    layout_data = json.load(f)
+                st = layout_file.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+
+                # Only the header fields are needed here; skip the full parse
+                # (rules included) when the file has not changed since last time.
+                cached = self._layout_info_cache.get(cache_key)
+                if cached is not None and cached[0] == stamp:
+                    layouts.append(dict(cached[1]))
+                    continue
+
+                with open(layout_file, "rb") as f:
+                    layout_data = json.loads(f.read())
 
                 layout_info = {
                     "name": layout_data.get("name", layout_file.stem),
@@ -149,17 +211,33 @@ class LayoutManager:
                     ),
                     "schema_version": layout_data.get("schema_version", 1),
                 }
-                layouts.append(layout_info)
+                self._layout_info_cache[cache_key] = (stamp, layout_info)
+                layouts.append(dict(layout_info))
 
             except Exception as e:
+                self._layout_info_cache.pop(cache_key, None)
                 self.logger.error(f"Error reading layout file {layout_file}: {e}")
 
+        # Forget deleted files
+        for stale_key in self._layout_info_cache.keys() - seen:
+            del self._layout_info_cache[stale_key]
+
         self.logger.debug(f"Found {len(layouts)} layout(s)")
         return layouts
 
+    def _forget_cached_layout(self, file_name: str) -> None:
+        """Drop cached parse results for a layout file that was just written."""
+        self._layout_info_cache.pop(str(self.layouts_dir / file_name), None)
+        self._loaded_layout_cache.pop(file_name, None)
+        self._layout_preview_cache.pop(file_name[: -len(".json")], None)
+
     def load_layout(self, layout_name: str) -> Dict:
         """Load a layout file by name, migrating v1 -> v2 in-memory if needed.
 
+        The parsed, migrated and validated layout is reused until the file's
+        mtime or size changes, so the returned dict is shared between callers
+        and must be treated as read-only.
+
         Args:
             layout_name: Name of the layout file (with or without .json extension)
 
@@ -175,9 +253,16 @@ class LayoutManager:
         layout_path = self.layouts_dir / layout_name
 
         if not layout_path.exists():
+            self._loaded_layout_cache.pop(layout_name, None)
             raise LayoutError(f"Layout file not found: {layout_path}")
 
         try:
+            st = layout_path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._loaded_layout_cache.get(layout_name)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
             with open(layout_path, "r") as f:
                 layout_data = json.load(f)
 
@@ -197,6 +282,7 @@ class LayoutManager:
             self.logger.info(
                 f"Loaded layout '{layout_data.get('name')}' from {layout_path}"
             )
+            self._loaded_layout_cache[layout_name] = (stamp, layout_data)
             return layout_data
 
         except json.JSONDecodeError as e:
@@ -315,6 +401,9 @@ class LayoutManager:
         except LayoutError as e:
             return False, str(e)
 
+        # One pass over known monitors instead of a get_monitor() scan per slot
+        configs_by_id = {m["id"]: m for m in self.config_manager.get_all_monitors()}
+
         # Check orientation requirements
         for screen in screen_req.get("screens", []):
             slot = screen["slot"]
@@ -324,7 +413,7 @@ class LayoutManager:
                 return False, f"Slot {slot} is required but not in assignment"
 
             monitor_id = slot_map[slot]
-            cfg = self.config_manager.get_monitor(monitor_id)
+            cfg = configs_by_id.get(monitor_id)
             if not cfg:
                 return False, f"Monitor for slot {slot} not found in config"
 
@@ -434,6 +523,9 @@ class LayoutManager:
         dict that is owned by the frontend. The preview returns layout metadata
         only.
 
+        "data" and "screen_requirements" are the shared dicts cached by
+        load_layout, so they must be treated as read-only as well.
+
         Args:
             layout_name: Name of the layout to preview
 
@@ -445,15 +537,22 @@ class LayoutManager:
         """
         layout_data = self.load_layout(layout_name)
 
-        return {
-            "name": layout_data.get("name", layout_name),
-            "description": layout_data.get("description", ""),
-            "file_name": f"{layout_name}.json",
-            "schema_version": layout_data.get("schema_version", 2),
-            "screen_requirements": layout_data.get("screen_requirements", {}),
-            "rules_count": len(layout_data.get("rules", [])),
-            "data": layout_data,
-        }
+        # The metadata only changes when load_layout hands back a new dict.
+        cached = self._layout_preview_cache.get(layout_name)
+        if cached is not None and cached[0] is layout_data:
+            preview = cached[1]
+        else:
+            preview = {
+                "name": layout_data.get("name", layout_name),
+                "description": layout_data.get("description", ""),
+                "file_name": f"{layout_name}.json",
+                "schema_version": layout_data.get("schema_version", 2),
+                "screen_requirements": layout_data.get("screen_requirements", {}),
+                "rules_count": len(layout_data.get("rules", [])),
+            }
+            self._layout_preview_cache[layout_name] = (layout_data, preview)
+
+        return {**preview, "data": layout_data}
 
     def create_layout_from_current_config(
         self, layout_name: str, description: str = ""
@@ -522,8 +621,8 @@ class LayoutManager:
             }
 
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(layout_data, f, indent=2)
+            write_layout_file(file_path, layout_data)
+            self._forget_cached_layout(file_name)
 
             self.logger.info(f"Created new layout: {file_path}")
 
@@ -12,7 +12,12 @@ never persisted here.
 """
 
 import logging
-from typing import Dict
+import sys
+from typing import Dict, Optional
+
+# Shared orientation strings: comparisons against them hit the identity fast path
+_HORIZONTAL = sys.intern("horizontal")
+_VERTICAL = sys.intern("vertical")
 
 
 class LayoutError(Exception):
@@ -33,13 +38,17 @@ class LayoutMatcher:
         self.logger = logging.getLogger("ScreenAssign.LayoutMatcher")
         self.monitor_manager = monitor_manager
 
+        # identity_key -> monitor_id map, reused while the topology is unchanged
+        self._identity_map_version: Optional[int] = None
+        self._identity_map: Dict[str, str] = {}
+
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
 
     def get_orientation(self, width: int, height: int) -> str:
         """Return 'horizontal' if width > height, else 'vertical'."""
-        return "horizontal" if width > height else "vertical"
+        return _HORIZONTAL if width > height else _VERTICAL
 
     def build_slot_map(self, assignment: Dict[str, str]) -> Dict[int, str]:
         """Resolve slot numbers to monitor IDs using the caller-supplied assignment.
@@ -73,19 +82,17 @@ class LayoutMatcher:
         # Fresh topology
         self.monitor_manager.detect_monitors()
 
-        # Build identity_key -> monitor_id from connected monitors
-        identity_map: Dict[str, str] = {}
-        for (
-            monitor_id,
-            monitor,
-        ) in self.monitor_manager.get_all_connected_monitors().items():
-            cfg = self.monitor_manager.config_manager.get_monitor(monitor_id)
-            if not cfg:
-                continue
-            key = f"{monitor.x}_{monitor.y}_{cfg['width']}_{cfg['height']}"
-            identity_map[key] = monitor_id
+        # Cheap count check before resolving any identity keys. Several slots
+        # may share one monitor, so only distinct identity keys are counted.
+        connected_count = self.monitor_manager.count_connected()
+        distinct_count = len(set(assignment.values()))
+        if distinct_count > connected_count:
+            raise LayoutError(
+                f"Assignment uses {distinct_count} distinct monitor(s) but only "
+                f"{connected_count} are connected"
+            )
 
-        self.logger.debug(f"Connected identity map: {identity_map}")
+        identity_map = self._get_identity_map()
 
         # Resolve each slot
         slot_map: Dict[int, str] = {}
@@ -106,5 +113,36 @@ class LayoutMatcher:
 
             slot_map[slot] = identity_map[identity_key]
 
-        self.logger.debug(f"Resolved slot map: {slot_map}")
+        self.logger.debug("Resolved slot map: %s", slot_map)
         return slot_map
+
+    def _get_identity_map(self) -> Dict[str, str]:
+        """Return the identity_key -> monitor_id map for connected monitors.
+
+        The map is only rebuilt when MonitorManager.topology_version has moved
+        since it was last built, i.e. when detect_monitors saw different ids,
+        positions or sizes.
+        """
+        version = self.monitor_manager.topology_version
+        if version == self._identity_map_version:
+            return self._identity_map
+
+        configs_by_id = {
+            m["id"]: m for m in self.monitor_manager.config_manager.get_all_monitors()
+        }
+
+        identity_map: Dict[str, str] = {}
+        for (
+            monitor_id,
+            monitor,
+        ) in self.monitor_manager.get_all_connected_monitors().items():
+            cfg = configs_by_id.get(monitor_id)
+            if not cfg:
+                continue
+            key = f"{monitor.x}_{monitor.y}_{cfg['width']}_{cfg['height']}"
+            identity_map[key] = monitor_id
+
+        self.logger.debug("Connected identity map: %s", identity_map)
+        self._identity_map_version = version
+        self._identity_map = identity_map
+        return identity_map
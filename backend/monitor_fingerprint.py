@@ -1,7 +1,23 @@
-import hashlib
+import functools
 import logging
+import re
 from typing import Dict, Optional, Tuple
 
+# Windows connector number embedded in monitor names, e.g. "\\.\DISPLAY2"
+_DISPLAY_RE = re.compile(r"DISPLAY(\d+)")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_display_number(name: str) -> Optional[str]:
+    """Return the DISPLAY# digits from a monitor name, or None.
+
+    Monitor names only change on hotplug, so repeated detect cycles hit the
+    cache instead of re-running the regex. The digits are kept as a string
+    so fingerprints stay byte-identical to the ones already persisted.
+    """
+    match = _DISPLAY_RE.search(name)
+    return match.group(1) if match else None
+
 
 class MonitorFingerprint:
     """Generate stable hardware fingerprints for monitors.
@@ -35,66 +51,38 @@ class MonitorFingerprint:
             - primary: Windows connector + resolution (most stable across machines)
             - secondary: Resolution only (fallback, works across Y offset changes)
         """
-        # Primary: Windows DISPLAY connector + resolution
-        # Each physical monitor gets a unique DISPLAY# number from Windows
-        # Combined with resolution, this uniquely identifies the monitor
-        primary_fp = self._generate_connector_resolution_fp(monitor_data)
+        # Read the inputs once and build both strings from them.
+        width = monitor_data.get("width", 0)
+        height = monitor_data.get("height", 0)
+
+        if width == 0 or height == 0:
+            raise ValueError("Invalid monitor dimensions")
 
         # Secondary: Resolution only (fallback for cross-machine configs)
         # When a config moves to another machine, DISPLAY# might differ
-        # but resolution stays the same, allowing matching by resolution
-        secondary_fp = self._generate_resolution_fp(monitor_data)
+        # but resolution stays the same, allowing matching by resolution.
+        # Stable across detection orders, Y offsets and layout changes.
+        secondary_fp = f"{width}x{height}"
+
+        # Primary: Windows DISPLAY connector + resolution, e.g. "DISPLAY1_1920x1080"
+        # Each physical monitor gets a unique DISPLAY# number from Windows
+        # Combined with resolution, this uniquely identifies the monitor.
+        # Falls back to the resolution when the name carries no connector.
+        display_number = _parse_display_number(monitor_data.get("name", ""))
+        if display_number is not None:
+            primary_fp = f"DISPLAY{display_number}_{secondary_fp}"
+        else:
+            primary_fp = secondary_fp
+
+        self.logger.debug(
+            "Generated fingerprints: primary=%s secondary=%s", primary_fp, secondary_fp
+        )
 
         return {
             "primary": primary_fp,  # Most reliable across machines
             "secondary": secondary_fp,  # Fallback for Y offset/layout changes
         }
 
-    def _generate_connector_resolution_fp(self, monitor_data: Dict) -> str:
-        """Generate fingerprint from Windows connector name + resolution.
-
-        Windows DISPLAY connector names are stable across reboots on same hardware.
-        Combined with resolution provides strong identification across machines.
-
-        Example: "DISPLAY1_1920x1080"
-        """
-        name = monitor_data.get("name", "")
-        width = monitor_data.get("width", 0)
-        height = monitor_data.get("height", 0)
-
-        import re
-
-        # Try to extract DISPLAY# from name
-        match = re.search(r"DISPLAY(\d+)", name)
-        if match:
-            connector = f"DISPLAY{match.group(1)}"
-            fp = f"{connector}_{width}x{height}"
-            self.logger.debug(f"Generated connector+resolution FP: {fp}")
-            return fp
-
-        # Fallback: just use resolution
-        return self._generate_resolution_fp(monitor_data)
-
-    def _generate_resolution_fp(self, monitor_data: Dict) -> str:
-        """Generate fingerprint from resolution only.
-
-        This is stable across:
-        - Different Windows detection orders
-        - Different machine Y offsets (position changes)
-        - Position/layout changes
-
-        Works well when exporting config to different machines with same monitors.
-        """
-        width = monitor_data.get("width", 0)
-        height = monitor_data.get("height", 0)
-
-        if width == 0 or height == 0:
-            raise ValueError("Invalid monitor dimensions")
-
-        fp = f"{width}x{height}"
-        self.logger.debug(f"Generated resolution FP: {fp}")
-        return fp
-
     def fingerprints_match(
         self, fp1: Dict[str, str], fp2: Dict[str, str], strict: bool = False
     ) -> Tuple[bool, str]:
@@ -139,18 +127,26 @@ class MonitorFingerprint:
             Updated monitor data to save to config
         """
         # Keep the original ID
-        updated = {**known_monitor}
-
-        # Update dynamic properties
-        updated["x"] = detected_monitor_data.get("x", known_monitor.get("x"))
-        updated["y"] = detected_monitor_data.get("y", known_monitor.get("y"))
-        updated["is_primary"] = detected_monitor_data.get(
-            "is_primary", known_monitor.get("is_primary", False)
+        updated = known_monitor.copy()
+        detected = detected_monitor_data
+
+        # Update dynamic properties and the display name (use latest name).
+        # Fallbacks are only looked up when the detected data lacks the key.
+        updated.update(
+            {
+                "x": detected["x"] if "x" in detected else known_monitor.get("x"),
+                "y": detected["y"] if "y" in detected else known_monitor.get("y"),
+                "is_primary": (
+                    detected["is_primary"]
+                    if "is_primary" in detected
+                    else known_monitor.get("is_primary", False)
+                ),
+                "name": (
+                    detected["name"] if "name" in detected else known_monitor.get("name")
+                ),
+            }
         )
 
-        # Update name for display (use latest name)
-        updated["name"] = detected_monitor_data.get("name", known_monitor.get("name"))
-
         # Regenerate fingerprints for updated position data
         updated["fingerprints"] = self.generate_fingerprint(updated)
 
@@ -1,9 +1,32 @@
 import logging
+import time
 import ctypes
+import ctypes.wintypes
 from screeninfo import get_monitors
 from .config_manager import ConfigManager
 from .monitor_fingerprint import MonitorFingerprint
 
+MONITOR_DEFAULTTONEAREST = 2
+
+# Resolve the DLLs once instead of going through ctypes.windll on every call.
+# shcore (GetScaleFactorForMonitor) only exists on Windows 8.1+.
+try:
+    _user32 = ctypes.windll.user32
+    _shcore = ctypes.windll.shcore
+except (AttributeError, OSError):
+    _user32 = None
+    _shcore = None
+else:
+    # Explicit prototypes: no per-call argument inference, and HMONITOR is
+    # returned as a pointer-sized handle instead of being truncated to c_int.
+    _user32.MonitorFromPoint.argtypes = [ctypes.wintypes.POINT, ctypes.wintypes.DWORD]
+    _user32.MonitorFromPoint.restype = ctypes.wintypes.HMONITOR
+    _shcore.GetScaleFactorForMonitor.argtypes = [
+        ctypes.wintypes.HMONITOR,
+        ctypes.POINTER(ctypes.c_int),
+    ]
+    _shcore.GetScaleFactorForMonitor.restype = ctypes.c_long  # HRESULT
+
 
 class MonitorManager:
     """Manages detection and tracking of connected monitors."""
@@ -31,6 +54,19 @@ class MonitorManager:
         # Used to reduce log noise (only log monitor list changes at INFO)
         self._last_detected_ids = None
 
+        # Bumped whenever detect_monitors sees a different topology (ids,
+        # positions or sizes) so callers can cache derived data cheaply.
+        self.topology_version = 0
+        self._last_topology = None
+
+        # DPI scale per monitor rect (x, y, width, height); cleared on topology change
+        self._dpi_cache: dict[tuple[int, int, int, int], float] = {}
+
+        # Raw screeninfo signature + result of the last full detect pass
+        self._last_signature = None
+        self._last_detect_result: list = []
+        self._last_detect_time = 0.0  # time.monotonic() of the last successful pass
+
     def detect_monitors(self):
         """Detect all currently connected monitors and update the configuration.
 
@@ -39,6 +75,30 @@ class MonitorManager:
         """
         try:
             monitors = get_monitors()
+
+            # Nothing changed since the last pass: skip fingerprinting and the
+            # per-monitor add_monitor() config work. The known-monitor count is
+            # part of the key so a monitor deleted from config is re-registered.
+            signature = (
+                tuple(
+                    sorted(
+                        (
+                            m.x,
+                            m.y,
+                            m.width,
+                            m.height,
+                            getattr(m, "name", None) or "",
+                            bool(getattr(m, "is_primary", False)),
+                        )
+                        for m in monitors
+                    )
+                ),
+                len(self.config_manager.get_all_monitors()),
+            )
+            if signature == self._last_signature:
+                self._last_detect_time = time.monotonic()
+                return list(self._last_detect_result)
+
             detected_ids = []
 
             for monitor in monitors:
@@ -58,12 +118,18 @@ class MonitorManager:
                 # Update the connected monitors map
                 self.connected_monitors[monitor_id] = monitor
 
-            # Find monitors that are no longer connected
-            all_monitors = self.config_manager.get_all_monitors()
-            for monitor in all_monitors:
-                if monitor["id"] not in detected_ids:
-                    if monitor["id"] in self.connected_monitors:
-                        del self.connected_monitors[monitor["id"]]
+            # Drop monitors that are no longer connected
+            for monitor_id in self.connected_monitors.keys() - set(detected_ids):
+                del self.connected_monitors[monitor_id]
+
+            topology = tuple(
+                (monitor_id, monitor.x, monitor.y, monitor.width, monitor.height)
+                for monitor_id, monitor in self.connected_monitors.items()
+            )
+            if topology != self._last_topology:
+                self._last_topology = topology
+                self.topology_version += 1
+                self._dpi_cache.clear()
 
             # Only log at INFO when the set of detected monitors changes.
             detected_key = tuple(sorted(detected_ids))
@@ -74,14 +140,39 @@ class MonitorManager:
                 self._last_detected_ids = detected_key
             else:
                 self.logger.debug(
-                    f"Detected {len(detected_ids)} monitors: {list(detected_key)}"
+                    "Detected %d monitors: %s", len(detected_ids), list(detected_key)
                 )
+
+            # add_monitor may have appended new monitors; key on the final count
+            self._last_signature = (
+                signature[0],
+                len(self.config_manager.get_all_monitors()),
+            )
+            self._last_detect_result = list(detected_ids)
+            self._last_detect_time = time.monotonic()
             return detected_ids
 
         except Exception as e:
             self.logger.error(f"Error detecting monitors: {str(e)}")
             return []
 
+    def get_cached_connected_ids(self, max_age_s=5.0, force=False):
+        """Get connected monitor IDs, re-detecting only if the last pass is old.
+
+        The service loop re-detects on display changes, so API handlers can
+        usually answer from the last result instead of enumerating monitors.
+
+        Args:
+            max_age_s (float): Maximum age in seconds of the last detect pass
+            force (bool): Always run detect_monitors (e.g. explicit refresh)
+
+        Returns:
+            list: List of connected monitor IDs
+        """
+        if force or time.monotonic() - self._last_detect_time > max_age_s:
+            return self.detect_monitors()
+        return self.get_connected_monitor_ids()
+
     def _detect_monitor_dpi_scale(self, monitor):
         """Detect the DPI scale factor for a monitor using Windows API.
 
@@ -91,24 +182,44 @@ class MonitorManager:
         Returns:
             float: DPI scale factor (1.0 = 100%, 1.25 = 125%, 1.5 = 150%, etc.)
         """
+        cache_key = (monitor.x, monitor.y, monitor.width, monitor.height)
+        cached = self._dpi_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        scale = self._query_monitor_dpi_scale(monitor)
+        if scale is None:
+            # Don't pin a transient failure until the next topology change
+            return 1.0
+        self._dpi_cache[cache_key] = scale
+        return scale
+
+    def _query_monitor_dpi_scale(self, monitor):
+        """Ask Windows for a monitor's scale factor (uncached).
+
+        Args:
+            monitor: Monitor object from screeninfo
+
+        Returns:
+            float | None: DPI scale factor, or None if it cannot be determined
+        """
         try:
-            user32 = ctypes.windll.user32
-            shcore = ctypes.windll.shcore
+            if _user32 is None or _shcore is None:
+                raise OSError("user32/shcore not available")
 
             # Create a POINT at the center of the monitor
             center_x = monitor.x + (monitor.width // 2)
             center_y = monitor.y + (monitor.height // 2)
 
             # Get monitor handle using MonitorFromPoint
-            MONITOR_DEFAULTTONEAREST = 2
-            hmonitor = user32.MonitorFromPoint(
+            hmonitor = _user32.MonitorFromPoint(
                 ctypes.wintypes.POINT(center_x, center_y), MONITOR_DEFAULTTONEAREST
             )
 
             # Get scale factor (Windows 8.1+)
             # DEVICE_SCALE_FACTOR enum values: 100, 120, 125, 140, 150, 160, 175, 180, 200, 225, 250, etc.
             scale_factor = ctypes.c_int()
-            result = shcore.GetScaleFactorForMonitor(
+            result = _shcore.GetScaleFactorForMonitor(
                 hmonitor, ctypes.byref(scale_factor)
             )
 
@@ -116,19 +227,22 @@ class MonitorManager:
                 # Convert from percentage to decimal (100 -> 1.0, 150 -> 1.5, etc.)
                 scale = scale_factor.value / 100.0
                 self.logger.debug(
-                    f"Monitor at ({monitor.x},{monitor.y}): "
-                    f"scale={scale_factor.value}% ({scale:.2f}x)"
+                    "Monitor at (%s,%s): scale=%s%% (%.2fx)",
+                    monitor.x,
+                    monitor.y,
+                    scale_factor.value,
+                    scale,
                 )
                 return scale
             else:
                 self.logger.debug(
-                    f"GetScaleFactorForMonitor returned {result}, using 1.0"
+                    "GetScaleFactorForMonitor returned %s, using 1.0", result
                 )
-                return 1.0
+                return None
 
         except Exception as e:
-            self.logger.debug(f"Could not detect DPI scale: {e}, using 1.0")
-            return 1.0
+            self.logger.debug("Could not detect DPI scale: %s, using 1.0", e)
+            return None
 
     def _generate_monitor_name(self, monitor):
         """Generate a friendly name for a monitor.
@@ -139,16 +253,20 @@ class MonitorManager:
         Returns:
             str: Friendly name for the monitor
         """
-        if hasattr(monitor, "name") and monitor.name:
-            return f"{monitor.name} ({monitor.width}×{monitor.height})"
+        resolution = f"({monitor.width}×{monitor.height})"
+
+        name = getattr(monitor, "name", None)
+        if name:
+            return f"{name} {resolution}"
 
         # Generate a name based on position
-        if monitor.x == 0 and monitor.y == 0:
+        x, y = monitor.x, monitor.y
+        if x == 0 and y == 0:
             position = "Primary"
         else:
-            position = f"at ({monitor.x}, {monitor.y})"
+            position = f"at ({x}, {y})"
 
-        return f"Monitor {position} ({monitor.width}×{monitor.height})"
+        return f"Monitor {position} {resolution}"
 
     def is_monitor_connected(self, monitor_id):
         """Check if a monitor is currently connected.
@@ -161,6 +279,14 @@ class MonitorManager:
         """
         return monitor_id in self.connected_monitors
 
+    def count_connected(self):
+        """Get the number of currently connected monitors.
+
+        Returns:
+            int: Number of connected monitors
+        """
+        return len(self.connected_monitors)
+
     def get_connected_monitor_ids(self):
         """Get the IDs of all currently connected monitors.
 
@@ -196,24 +322,24 @@ class MonitorManager:
                   identity_key is formatted as  x_y_W_H  (e.g. "-1920_0_1080_1920")
                   and is used by the frontend to build the slot->monitor assignment.
         """
-        self.detect_monitors()
-        monitors_with_dpi = []
-
-        for monitor_id, monitor in self.connected_monitors.items():
-            # Get base monitor config
-            monitor_config = self.config_manager.get_monitor(monitor_id)
-            if monitor_config:
-                # Add runtime DPI scale
-                dpi_scale = self._detect_monitor_dpi_scale(monitor)
-                monitor_info = monitor_config.copy()
-                monitor_info["dpi_scale"] = dpi_scale
-                # Add identity key used for slot assignment
-                monitor_info["identity_key"] = (
+        self.get_cached_connected_ids()
+
+        # Base monitor configs, indexed once rather than scanned per monitor
+        configs_by_id = {m["id"]: m for m in self.config_manager.get_all_monitors()}
+
+        return [
+            {
+                **monitor_config,
+                # Runtime DPI scale
+                "dpi_scale": self._detect_monitor_dpi_scale(monitor),
+                # Identity key used for slot assignment
+                "identity_key": (
                     f"{monitor.x}_{monitor.y}_{monitor_config['width']}_{monitor_config['height']}"
-                )
-                monitors_with_dpi.append(monitor_info)
-
-        return monitors_with_dpi
+                ),
+            }
+            for monitor_id, monitor in self.connected_monitors.items()
+            if (monitor_config := configs_by_id.get(monitor_id))
+        ]
 
     def get_primary_monitor_id(self):
         """Get the ID of the primary monitor.
@@ -8,6 +8,7 @@ from datetime import datetime
 from .config_manager import ConfigManager
 from .layout_manager import LayoutManager
 from .monitor_manager import MonitorManager
+from .window_events import WindowEventListener
 from .window_manager import WindowManager
 
 
@@ -22,18 +23,13 @@ class ScreenAssignService:
         """
         self.logger = logging.getLogger("ScreenAssign.Service")
 
-        # Initialize managers
-        self.config_manager = ConfigManager(config_path)
-        self.monitor_manager = MonitorManager(self.config_manager)
-
+        # Managers are created on first access (see the properties below), so
+        # calls like get_status() don't load config or scan layouts.
+        self._config_path = config_path
         # Layouts directory is in backend/layouts
-        layouts_dir = os.path.join(os.path.dirname(__file__), "layouts")
-        self.layout_manager = LayoutManager(
-            self.config_manager, self.monitor_manager, layouts_dir=layouts_dir
-        )
-        self.window_manager = WindowManager(
-            self.config_manager, self.monitor_manager, self.layout_manager
-        )
+        self._layouts_dir = os.path.join(os.path.dirname(__file__), "layouts")
+        self._managers = {}
+        self._managers_lock = threading.RLock()
 
         # Service state
         self.running = False
@@ -45,15 +41,92 @@ class ScreenAssignService:
             "rules_applied": 0,
             "errors": 0,
         }
-
-        # Window/tab cache for fast window switcher access
-        self.cached_windows = []
+        # time.time() of the last rule pass; formatted into "last_run" on read
+        self._last_run_ts = None
+
+        # Window/tab cache for fast window switcher access.
+        # Keyed by hwnd and updated per window from WinEvent notifications;
+        # cache_version is bumped on every effective change, including moves,
+        # maximize/restore and monitor changes (the cached dicts carry them).
+        self._cached_windows_by_hwnd: dict[int, dict] = {}
+        self.cache_version = 0
         self.cache_timestamp = 0
-        self.cache_lock = threading.Lock()
+
+        # (windows, timestamp) published after each update. The service loop
+        # is the only writer, and readers take the reference without locking:
+        # replacing the attribute is a single store, and the tuple itself is
+        # never mutated.
+        self._window_snapshot: tuple[tuple[dict, ...], float] = ((), 0)
+
+        # Set by the window event listener, stop() and rule application to
+        # wake the service loop
+        self._wake_event = threading.Event()
+        self.window_events = WindowEventListener(self._wake_event)
+
+        # Set after rules moved windows so the loop rebuilds the window cache
+        self._window_refresh_requested = threading.Event()
+
+        # What the last complete rule pass saw, so unchanged ticks can be skipped
+        self.max_idle_reapply = 60  # seconds - re-run rules at least this often
+        self._last_rules_state = None
+        self._last_rules_layout = None
+        self._last_rules_time = 0.0
 
         # No longer using signal files - service runs when started
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+    def _get_manager(self, name, factory):
+        """Return the named manager, creating it once on first use.
+
+        Args:
+            name (str): Manager key
+            factory (callable): Builds the manager; may access other managers
+
+        Returns:
+            The manager instance
+        """
+        manager = self._managers.get(name)
+        if manager is None:
+            # Request threads and the service loop may race on first access
+            with self._managers_lock:
+                manager = self._managers.get(name)
+                if manager is None:
+                    manager = factory()
+                    self._managers[name] = manager
+        return manager
+
+    @property
+    def config_manager(self):
+        """ConfigManager, created on first access."""
+        return self._get_manager("config", lambda: ConfigManager(self._config_path))
+
+    @property
+    def monitor_manager(self):
+        """MonitorManager, created on first access."""
+        return self._get_manager("monitor", lambda: MonitorManager(self.config_manager))
+
+    @property
+    def layout_manager(self):
+        """LayoutManager, created on first access."""
+        return self._get_manager(
+            "layout",
+            lambda: LayoutManager(
+                self.config_manager,
+                self.monitor_manager,
+                layouts_dir=self._layouts_dir,
+            ),
+        )
+
+    @property
+    def window_manager(self):
+        """WindowManager, created on first access."""
+        return self._get_manager(
+            "window",
+            lambda: WindowManager(
+                self.config_manager, self.monitor_manager, self.layout_manager
+            ),
+        )
+
     def start(self):
         """Start the ScreenAssign service."""
         if self.running:
@@ -62,7 +135,6 @@ class ScreenAssignService:
 
         self.running = True
         self.status["status"] = "starting"
-        self._save_status()
 
         # Start the service thread
         self.service_thread = threading.Thread(target=self._service_loop)
@@ -80,14 +152,15 @@ class ScreenAssignService:
 
         self.running = False
         self.status["status"] = "stopping"
-        self._save_status()
+
+        # Wake the loop so it exits without waiting out its timeout
+        self._wake_event.set()
 
         # Wait for thread to exit
         if self.service_thread:
             self.service_thread.join(timeout=5)
 
         self.status["status"] = "stopped"
-        self._save_status()
 
         self.logger.info("Service stopped")
         return True
@@ -103,35 +176,104 @@ class ScreenAssignService:
         Returns:
             dict: Service status information
         """
-        return self.status
-
-    def apply_rules_now(self, layout_name: str, assignment: dict):
+        status = dict(self.status)
+        if self._last_run_ts is not None:
+            status["last_run"] = datetime.fromtimestamp(self._last_run_ts).isoformat()
+        return status
+
+    def apply_rules_now(
+        self, layout_name: str, assignment: dict, only_if_changed: bool = False
+    ):
         """Apply all rules immediately.
 
         Args:
             layout_name: Name of the layout whose rules to apply
             assignment:  Slot->identity_key mapping from the frontend,
                          e.g. {"1": "-1920_0_1080_1920", "2": "0_0_1920_1080"}
+            only_if_changed: Skip the pass if the window cache (including
+                         window geometry), monitor topology, layout and
+                         assignment are all unchanged since the last clean
+                         pass (at most max_idle_reapply seconds ago). Used by
+                         the frontend's periodic tick.
 
         Returns:
             dict: Results of rule application
         """
         # Update connected monitors
-        self.monitor_manager.detect_monitors()
+        self.monitor_manager.get_cached_connected_ids()
 
-        self.layout_manager.ensure_layout_can_apply(layout_name, assignment)
+        layout_data = self.layout_manager.ensure_layout_can_apply(
+            layout_name, assignment
+        )
+
+        state = (
+            layout_name,
+            tuple(sorted(assignment.items())),
+            self.cache_version,
+            self.monitor_manager.topology_version,
+        )
+        if (
+            only_if_changed
+            and state == self._last_rules_state
+            and layout_data is self._last_rules_layout
+            and time.monotonic() - self._last_rules_time < self.max_idle_reapply
+        ):
+            return {
+                "applied": 0,
+                "skipped_no_monitor": 0,
+                "skipped_no_window": 0,
+                "failed": 0,
+                "details": [],
+                "skipped_unchanged": True,
+            }
 
         # Apply all rules
-        results = self.window_manager.apply_rules(layout_name, assignment)
+        results = self.window_manager.apply_rules(
+            layout_name, assignment, windows=self._event_fed_windows()
+        )
+
+        # Only a pass without failures is remembered; failures retry next tick
+        if results["failed"]:
+            self._last_rules_state = None
+            self._last_rules_layout = None
+        else:
+            self._last_rules_state = state
+            self._last_rules_layout = layout_data
+            self._last_rules_time = time.monotonic()
 
         # Update status
-        self.status["last_run"] = datetime.now().isoformat()
+        self._last_run_ts = time.time()
         self.status["rules_applied"] = results["applied"]
         self.status["errors"] = results["failed"]
-        self._save_status()
+
+        if results["applied"]:
+            self._request_window_refresh()
 
         return results
 
+    def _event_fed_windows(self):
+        """Return the event-maintained window list if it is up to date.
+
+        While the service loop runs with the WinEvent listener, the window
+        cache follows top-level windows being created, destroyed, shown,
+        hidden, renamed, minimized/restored, moved, resized, maximized or
+        snapped, so rule passes can use it instead of enumerating all windows
+        again.
+
+        Returns:
+            tuple | None: Cached window dicts (read-only), or None if events
+                are pending or the cache isn't event-driven
+        """
+        if (
+            not self.running
+            or not self.window_events.active
+            or not self.cache_timestamp
+            or self.window_events.windows_changed.is_set()
+            or self._window_refresh_requested.is_set()
+        ):
+            return None
+        return self._window_snapshot[0]
+
     def apply_rules_for_window(
         self, hwnd: int, layout_name: str, assignment: dict
     ) -> dict:
@@ -145,9 +287,42 @@ class ScreenAssignService:
         Returns:
             dict: Result of rule application for that window
         """
-        self.monitor_manager.detect_monitors()
+        self.monitor_manager.get_cached_connected_ids()
         self.layout_manager.ensure_layout_can_apply(layout_name, assignment)
-        return self.window_manager.apply_rules_for_window(hwnd, layout_name, assignment)
+        result = self.window_manager.apply_rules_for_window(
+            hwnd, layout_name, assignment
+        )
+        if result.get("changed"):
+            self._request_window_refresh()
+        return result
+
+    def register_switcher_window(self, hwnd: int):
+        """Exclude a window switcher window from the window list by handle.
+
+        Args:
+            hwnd: Window handle of the switcher window
+        """
+        self.window_manager.register_switcher_hwnd(hwnd)
+        self._request_window_refresh()
+
+    def unregister_switcher_window(self, hwnd: int):
+        """Put a window switcher window back into the window list handling.
+
+        Args:
+            hwnd: Window handle passed to register_switcher_window()
+        """
+        self.window_manager.unregister_switcher_hwnd(hwnd)
+        self._request_window_refresh()
+
+    def _request_window_refresh(self):
+        """Ask the service loop to rebuild the window cache right away.
+
+        Used after rules moved windows or the window filter changed, so the
+        cache doesn't depend on the listener having seen every change (it may
+        not be running, and filter changes raise no window events at all).
+        """
+        self._window_refresh_requested.set()
+        self._wake_event.set()
 
     def _service_loop(self):
         """Main service loop that runs in a separate thread.
@@ -156,36 +331,43 @@ class ScreenAssignService:
         here.  The frontend owns that timer so it can suppress rule ticks while
         the switcher overlay is visible, preventing focus theft.
         Use POST /apply-rules from the frontend to trigger rule application.
+
+        Window and monitor refreshes are event-driven when the WinEvent /
+        WM_DISPLAYCHANGE listener is available; the intervals below are then
+        only backstops. Without the listener the loop polls as before.
         """
-        check_interval = 1  # seconds - check frequently for cache updates
-        window_cache_interval = 2  # seconds - faster updates for window switcher
-        monitor_detect_interval = 30  # seconds
+        window_cache_interval = 2  # seconds - polling fallback for window switcher
+        monitor_detect_interval = 30  # seconds - polling fallback
+        event_backstop_interval = 60  # seconds - full refresh even without events
+        min_refresh_interval = 0.25  # seconds - coalesce bursts of window events
         last_monitor_detect = 0
         last_window_cache_update = 0
 
+        events = self.window_events
+        events.start()
+
         self.status["status"] = "running"
-        self._save_status()
 
         while self.running:
+            # Cleared before the flags are checked so no wake-up can be lost
+            self._wake_event.clear()
             try:
                 current_time = time.time()
 
-                # Update window cache for window switcher (every 2 seconds)
-                if current_time - last_window_cache_update >= window_cache_interval:
-                    try:
-                        windows = self.window_manager.get_all_windows()
-                        with self.cache_lock:
-                            self.cached_windows = windows
-                            self.cache_timestamp = current_time
-                        last_window_cache_update = current_time
-                        self.logger.debug(
-                            f"Updated window cache: {len(windows)} windows"
-                        )
-                    except Exception as e:
-                        self.logger.error(f"Error updating window cache: {str(e)}")
-
-                # Periodically detect monitors
-                if current_time - last_monitor_detect >= monitor_detect_interval:
+                if events.active:
+                    window_interval = event_backstop_interval
+                    monitor_interval = event_backstop_interval
+                else:
+                    window_interval = window_cache_interval
+                    monitor_interval = monitor_detect_interval
+
+                # Detect monitors first so window monitor_ids use the new topology
+                displays_changed = events.displays_changed.is_set()
+                if (
+                    displays_changed
+                    or current_time - last_monitor_detect >= monitor_interval
+                ):
+                    events.displays_changed.clear()
                     monitor_ids = self.monitor_manager.detect_monitors()
                     self.status["monitors"] = [
                         self.config_manager.get_monitor(monitor_id)
@@ -193,19 +375,94 @@ class ScreenAssignService:
                     ]
                     last_monitor_detect = current_time
 
+                # Update window cache for window switcher: a full rebuild on
+                # the backstop interval or a display change, otherwise only
+                # the windows the listener reported.
+                if (
+                    displays_changed
+                    or self._window_refresh_requested.is_set()
+                    or current_time - last_window_cache_update >= window_interval
+                ):
+                    self._window_refresh_requested.clear()
+                    events.windows_changed.clear()
+                    events.pop_changed_hwnds()
+                    self._rebuild_window_cache(current_time)
+                    last_window_cache_update = current_time
+                elif (
+                    events.windows_changed.is_set()
+                    and current_time - last_window_cache_update >= min_refresh_interval
+                ):
+                    events.windows_changed.clear()
+                    self._update_window_cache(events.pop_changed_hwnds(), current_time)
+                    last_window_cache_update = current_time
+
             except Exception as e:
                 self.logger.error(f"Error in service loop: {str(e)}")
                 self.status["status"] = "error"
                 self.status["error_message"] = str(e)
-                self._save_status()
 
-            # Sleep before next check
-            time.sleep(check_interval)
+            # Sleep until the next event or the earliest due refresh
+            now = time.time()
+            if events.windows_changed.is_set():
+                timeout = last_window_cache_update + min_refresh_interval - now
+            else:
+                timeout = min(
+                    last_window_cache_update + window_interval,
+                    last_monitor_detect + monitor_interval,
+                ) - now
+            if timeout > 0:
+                self._wake_event.wait(timeout)
+
+        events.stop()
+
+    def _rebuild_window_cache(self, current_time: float):
+        """Replace the window cache with a full enumeration."""
+        try:
+            windows = self.window_manager.get_all_windows(force=True)
+            by_hwnd = {w["hwnd"]: w for w in windows}
+            if by_hwnd != self._cached_windows_by_hwnd:
+                self._cached_windows_by_hwnd = by_hwnd
+                self.cache_version += 1
+                self._window_snapshot = (tuple(windows), current_time)
+            else:
+                self._window_snapshot = (self._window_snapshot[0], current_time)
+            self.cache_timestamp = current_time
+            self.logger.debug(f"Rebuilt window cache: {len(windows)} windows")
+        except Exception as e:
+            self.logger.error(f"Error updating window cache: {str(e)}")
+
+    def _update_window_cache(self, hwnds: set[int], current_time: float):
+        """Refresh only the given windows in the cache.
 
-    def _save_status(self):
-        """Save current status to the status file."""
-        # Status is kept in-memory only - no disk persistence needed.
-        return
+        Args:
+            hwnds: Handles reported by the window event listener
+            current_time: Timestamp to record for the cache
+        """
+        if not hwnds:
+            return
+        try:
+            updates = {
+                hwnd: self.window_manager.get_window_info(hwnd, check_visible=True)
+                for hwnd in hwnds
+            }
+            cache = self._cached_windows_by_hwnd
+            changed = False
+            for hwnd, info in updates.items():
+                if info is None:
+                    changed |= cache.pop(hwnd, None) is not None
+                elif cache.get(hwnd) != info:
+                    cache[hwnd] = info
+                    changed = True
+            if changed:
+                self.cache_version += 1
+                windows = tuple(cache.values())
+            else:
+                windows = self._window_snapshot[0]
+            self.cache_timestamp = current_time
+            self._window_snapshot = (windows, current_time)
+            self.logger.debug(f"Updated window cache for {len(hwnds)} window(s)")
+        except Exception as e:
+            self.logger.error(f"Error updating window cache: {str(e)}")
 
     # API methods for Dashboard integration
 
@@ -217,14 +474,16 @@ class ScreenAssignService:
         """
         return self.config_manager.get_all_monitors()
 
-    def get_monitors_with_status(self):
+    def get_monitors_with_status(self, force=False):
         """Get all known monitors with connection status.
 
+        Args:
+            force (bool): Re-detect monitors even if the last pass is recent
+
         Returns:
             list: All monitors with 'connected' field added
         """
-        self.monitor_manager.detect_monitors()
-        connected_ids = set(self.monitor_manager.get_connected_monitor_ids())
+        connected_ids = set(self.monitor_manager.get_cached_connected_ids(force=force))
 
         all_monitors = self.config_manager.get_all_monitors()
         for monitor in all_monitors:
@@ -232,14 +491,16 @@ class ScreenAssignService:
 
         return all_monitors
 
-    def get_connected_monitors(self):
+    def get_connected_monitors(self, force=False):
         """Get currently connected monitors.
 
+        Args:
+            force (bool): Re-detect monitors even if the last pass is recent
+
         Returns:
             list: Currently connected monitors
         """
-        self.monitor_manager.detect_monitors()
-        connected_ids = self.monitor_manager.get_connected_monitor_ids()
+        connected_ids = self.monitor_manager.get_cached_connected_ids(force=force)
         return [
             self.config_manager.get_monitor(monitor_id) for monitor_id in connected_ids
         ]
@@ -255,22 +516,21 @@ class ScreenAssignService:
     def get_cached_windows_and_tabs(self):
         """Get cached windows for fast window switcher access.
 
+        Lock-free: returns the snapshot published by the last cache update.
+        The windows tuple and its dicts are shared between callers; treat
+        them as read-only.
+
         Returns:
             dict: {
-                "windows": list of window dicts,
+                "windows": tuple of window dicts,
                 "timestamp": float (unix timestamp),
                 "age_ms": int (milliseconds since cache update)
             }
         """
-        with self.cache_lock:
-            current_time = time.time()
-            age_ms = (
-                int((current_time - self.cache_timestamp) * 1000)
-                if self.cache_timestamp > 0
-                else 0
-            )
-            return {
-                "windows": self.cached_windows.copy(),
-                "timestamp": self.cache_timestamp,
-                "age_ms": age_ms,
-            }
+        windows, timestamp = self._window_snapshot
+        age_ms = int((time.time() - timestamp) * 1000) if timestamp > 0 else 0
+        return {
+            "windows": windows,
+            "timestamp": timestamp,
+            "age_ms": age_ms,
+        }
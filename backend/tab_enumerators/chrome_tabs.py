@@ -1,11 +1,42 @@
 """Chrome tab storage and management."""
 
+import re
+import sys
 import time
 import threading
-from typing import Dict, List, Any, Optional
-from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional, Tuple
 from .base import TabEnumerator
 
+# Executable name per browser reported by the extension
+_BROWSER_EXES = {
+    "Chrome": "chrome.exe",
+    "Edge": "msedge.exe",
+    "Vivaldi": "vivaldi.exe",
+    "Brave": "brave.exe",
+    "Opera": "opera.exe",
+    "Chromium": "chromium.exe",
+}
+_DEFAULT_EXE = "chrome.exe"
+
+# Browser-internal pages; their "domain" (e.g. "settings") isn't shown in titles
+_INTERNAL_URL_PREFIXES = (
+    "chrome://",
+    "edge://",
+    "brave://",
+    "vivaldi://",
+    "opera://",
+    "about:",
+)
+
+# scheme "://" netloc; the netloc ends at the first "/", "?" or "#"
+_NETLOC_RE = re.compile(r"[a-z][a-z0-9+.\-]*://([^/?#]*)", re.IGNORECASE)
+
+
+def _url_domain(url: str) -> str:
+    """Return the netloc of a URL (same result as urlparse(url).netloc)."""
+    m = _NETLOC_RE.match(url)
+    return m.group(1) if m else ""
+
 
 class ChromeTabManager(TabEnumerator):
     """Manages Chrome tab data received from the extension."""
@@ -20,6 +51,14 @@ class ChromeTabManager(TabEnumerator):
         self._tabs_data: Dict[str, Any] = {}  # keyed by chrome_pid (extension ID)
         self._lock = threading.Lock()
 
+        # Assembled get_tabs() output; rebuilt only after update_tabs() or
+        # once an included instance goes stale
+        self._tabs_cache: Optional[List[Dict[str, Any]]] = None
+        self._tabs_cache_expires = 0.0
+
+        # tab id ("edge_123") -> (chrome_pid, entry), maintained by update_tabs()
+        self._tabs_by_id: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
     def update_tabs(
         self,
         chrome_pid: str,
@@ -35,78 +74,184 @@ class ChromeTabManager(TabEnumerator):
             timestamp: Unix timestamp in milliseconds
             browser_name: Name of the browser (Chrome, Edge, Vivaldi, etc.)
         """
+        # Every pushed tab repeats these; intern them so all entries (and
+        # entries reused across pushes) share one string object each
+        chrome_pid = sys.intern(chrome_pid)
+        browser_name = sys.intern(browser_name)
+        exe_name = _BROWSER_EXES.get(browser_name, _DEFAULT_EXE)
+
+        with self._lock:
+            previous = self._tabs_data.get(chrome_pid)
+        reusable = (
+            previous["entries_by_tab"]
+            if previous and previous["browser_name"] == browser_name
+            else {}
+        )
+
+        # URL parsing and title formatting happen once per update, outside
+        # the lock, instead of on every get_tabs() call
+        entries, entries_by_tab = self._build_tab_entries(
+            chrome_pid, tabs, browser_name, exe_name, reusable
+        )
+
         with self._lock:
+            # Evict stale instances here, on the (rare) write path
+            now = time.time()
+            stale_pids = [
+                pid
+                for pid, data in self._tabs_data.items()
+                if now - data["last_update"] > self.ttl_seconds
+            ]
+            for pid in stale_pids:
+                self._forget_instance_locked(pid)
+            self._forget_instance_locked(chrome_pid)
+
+            for entry in entries:
+                self._tabs_by_id[entry["id"]] = (chrome_pid, entry)
+
             self._tabs_data[chrome_pid] = {
                 "tabs": tabs,
+                "entries": entries,
+                "entries_by_tab": entries_by_tab,
                 "timestamp": timestamp,
-                "last_update": time.time(),
+                "last_update": now,
                 "browser_name": browser_name,
+                "exe_name": exe_name,
+            }
+            self._tabs_cache = None
+
+    def _forget_instance_locked(self, chrome_pid: str) -> None:
+        """Drop an instance and its id-index entries; caller must hold self._lock."""
+        data = self._tabs_data.pop(chrome_pid, None)
+        if data is None:
+            return
+        for entry in data["entries"]:
+            hit = self._tabs_by_id.get(entry["id"])
+            if hit is not None and hit[0] == chrome_pid:
+                del self._tabs_by_id[entry["id"]]
+
+    def _build_tab_entries(
+        self,
+        chrome_pid: str,
+        tabs: List[Dict[str, Any]],
+        browser_name: str,
+        exe_name: str,
+        reusable: Dict[Any, Tuple[tuple, Dict[str, Any]]],
+    ) -> Tuple[List[Dict[str, Any]], Dict[Any, Tuple[tuple, Dict[str, Any]]]]:
+        """Convert extension tab data into window switcher tab entries.
+
+        Entries are read-only once published, so a tab whose fields did not
+        change since the previous push reuses its previous entry instead of
+        being parsed and allocated again.
+
+        Args:
+            chrome_pid: Unique identifier for Chrome instance (extension ID)
+            tabs: List of tab dictionaries from extension
+            browser_name: Name of the browser
+            exe_name: Executable filename of the browser
+            reusable: entries_by_tab from this instance's previous push
+
+        Returns:
+            (entries, entries_by_tab): tab dictionaries compatible with window
+            switcher, and {chrome tab id: (source fields, entry)} for the
+            next push
+        """
+        source = sys.intern(browser_name.lower())
+        entries = []
+        entries_by_tab = {}
+
+        for tab in tabs:
+            url = tab.get("url", "")
+            title = tab.get("title", "Untitled")
+            key = (
+                tab["windowId"],
+                url,
+                title,
+                tab.get("active", False),
+                tab.get("pinned", False),
+                tab.get("audible", False),
+            )
+            previous = reusable.get(tab["id"])
+            if previous is not None and previous[0] == key:
+                entries.append(previous[1])
+                entries_by_tab[tab["id"]] = previous
+                continue
+
+            # Extract domain from URL
+            domain = _url_domain(url) if url else ""
+
+            # Format title with domain (not for browser-internal pages)
+            if domain and not url.startswith(_INTERNAL_URL_PREFIXES):
+                display_title = f"{title} ({domain})"
+            else:
+                display_title = title
+
+            entry = {
+                "type": "tab",
+                "source": source,
+                "id": f"{source}_{tab['id']}",
+                "chrome_tab_id": tab["id"],
+                "chrome_window_id": tab["windowId"],
+                "chrome_pid": chrome_pid,
+                "title": display_title,
+                "raw_title": title,  # Original title without domain
+                "url": url,
+                "domain": domain,
+                "active": tab.get("active", False),
+                "pinned": tab.get("pinned", False),
+                "audible": tab.get("audible", False),
+                "app_name": browser_name,
+                "app_display_name": browser_name,
+                "exe_name": exe_name,
             }
+            entries.append(entry)
+            entries_by_tab[tab["id"]] = (key, entry)
+
+        return entries, entries_by_tab
 
     def get_tabs(self) -> List[Dict[str, Any]]:
         """Get all current Chrome tabs across all instances.
 
+        The list is cached until tabs are updated or an instance goes stale,
+        and is shared between callers; treat it as read-only.
+
         Returns:
             List of tab dictionaries compatible with window switcher
         """
         with self._lock:
-            now = time.time()
-            all_tabs = []
-
-            # Clean up stale data
-            stale_pids = []
-            for pid, data in self._tabs_data.items():
-                if now - data["last_update"] > self.ttl_seconds:
-                    stale_pids.append(pid)
-
-            for pid in stale_pids:
-                del self._tabs_data[pid]
-
-            # Collect all tabs
-            for pid, data in self._tabs_data.items():
-                browser_name = data.get("browser_name", "Chrome")
-                exe_name = self._get_exe_name(browser_name)
-
-                for tab in data["tabs"]:
-                    # Extract domain from URL
-                    domain = ""
-                    url = tab.get("url", "")
-                    if url:
-                        try:
-                            parsed = urlparse(url)
-                            domain = parsed.netloc or ""
-                        except:
-                            pass
-
-                    # Format title with domain
-                    title = tab.get("title", "Untitled")
-                    if domain and not domain.startswith("chrome://"):
-                        display_title = f"{title} ({domain})"
-                    else:
-                        display_title = title
-
-                    all_tabs.append(
-                        {
-                            "type": "tab",
-                            "source": browser_name.lower(),
-                            "id": f"{browser_name.lower()}_{tab['id']}",
-                            "chrome_tab_id": tab["id"],
-                            "chrome_window_id": tab["windowId"],
-                            "chrome_pid": pid,
-                            "title": display_title,
-                            "raw_title": title,  # Original title without domain
-                            "url": url,
-                            "domain": domain,
-                            "active": tab.get("active", False),
-                            "pinned": tab.get("pinned", False),
-                            "audible": tab.get("audible", False),
-                            "app_name": browser_name,
-                            "app_display_name": browser_name,
-                            "exe_name": exe_name,
-                        }
-                    )
-
-            return all_tabs
+            return self._get_tabs_locked()
+
+    def _get_tabs_locked(self) -> List[Dict[str, Any]]:
+        """Return the (possibly cached) tab list; caller must hold self._lock."""
+        now = time.time()
+        if self._tabs_cache is not None and now <= self._tabs_cache_expires:
+            return self._tabs_cache
+
+        # Collect tabs of fresh instances; stale ones are skipped here and
+        # evicted by the next update_tabs()
+        all_tabs = []
+        expires = float("inf")
+        for data in self._tabs_data.values():
+            stale_at = data["last_update"] + self.ttl_seconds
+            if now > stale_at:
+                continue
+            all_tabs.extend(data["entries"])
+            expires = min(expires, stale_at)
+
+        self._tabs_cache = all_tabs
+        self._tabs_cache_expires = expires
+        return all_tabs
+
+    def _lookup_tab_locked(self, tab_id: str) -> Optional[Dict[str, Any]]:
+        """Find a tab of a fresh instance by id; caller must hold self._lock."""
+        hit = self._tabs_by_id.get(tab_id)
+        if hit is None:
+            return None
+        chrome_pid, entry = hit
+        data = self._tabs_data.get(chrome_pid)
+        if data is None or time.time() - data["last_update"] > self.ttl_seconds:
+            return None
+        return entry
 
     def _get_exe_name(self, browser_name: str) -> str:
         """Get the executable name for a browser.
@@ -117,15 +262,7 @@ class ChromeTabManager(TabEnumerator):
         Returns:
             Executable filename
         """
-        browser_exes = {
-            "Chrome": "chrome.exe",
-            "Edge": "msedge.exe",
-            "Vivaldi": "vivaldi.exe",
-            "Brave": "brave.exe",
-            "Opera": "opera.exe",
-            "Chromium": "chromium.exe",
-        }
-        return browser_exes.get(browser_name, "chrome.exe")
+        return _BROWSER_EXES.get(browser_name, _DEFAULT_EXE)
 
     def is_available(self) -> bool:
         """Check if Chrome tabs are available."""
@@ -152,8 +289,8 @@ class ChromeTabManager(TabEnumerator):
             True if tab exists, False otherwise
         """
         # Just verify the tab exists
-        tabs = self.get_tabs()
-        return any(tab["id"] == tab_id for tab in tabs)
+        with self._lock:
+            return self._lookup_tab_locked(tab_id) is not None
 
     def get_tab_by_id(self, tab_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific tab by ID.
@@ -164,11 +301,8 @@ class ChromeTabManager(TabEnumerator):
         Returns:
             Tab dictionary or None if not found
         """
-        tabs = self.get_tabs()
-        for tab in tabs:
-            if tab["id"] == tab_id:
-                return tab
-        return None
+        with self._lock:
+            return self._lookup_tab_locked(tab_id)
 
     def get_chrome_window_index(self, chrome_window_id: int, exe_name: str) -> int:
         """Return the 0-based creation-order index of a Chrome window among all windows
@@ -186,10 +320,12 @@ class ChromeTabManager(TabEnumerator):
             0-based index, or 0 if the window id is not found.
         """
         with self._lock:
+            now = time.time()
             window_ids: set[int] = set()
             for data in self._tabs_data.values():
-                browser_name = data.get("browser_name", "Chrome")
-                if self._get_exe_name(browser_name) != exe_name:
+                if data["exe_name"] != exe_name:
+                    continue
+                if now - data["last_update"] > self.ttl_seconds:
                     continue
                 for tab in data.get("tabs", []):
                     wid = tab.get("windowId")
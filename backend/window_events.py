@@ -0,0 +1,242 @@
+"""Win32 event listener that wakes the service loop when something changes.
+
+Instead of re-enumerating every window on a fixed timer, the service waits on
+the events exposed here:
+
+- windows_changed: a top-level window was created, destroyed, shown, hidden,
+  renamed, moved/resized (including maximize/restore and snaps) or
+  minimized/restored (SetWinEventHook, out-of-context). The affected handles
+  are collected for pop_changed_hwnds() so the cache can be updated per window.
+- displays_changed: the display topology or resolution changed
+  (WM_DISPLAYCHANGE broadcast to a hidden top-level window).
+
+Both set the shared wake event, so a single Event.wait() covers them.
+The hooks and the hidden window live on the listener's own thread, which
+runs the message loop that out-of-context WinEvent callbacks require.
+"""
+
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+from typing import Optional
+
+import win32api
+import win32con
+import win32gui
+
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+EVENT_SYSTEM_MINIMIZESTART = 0x0016
+EVENT_SYSTEM_MINIMIZEEND = 0x0017
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_HIDE = 0x8003  # CREATE, DESTROY, SHOW, HIDE are contiguous
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_ROOT = 2
+
+WinEventProc = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,  # hWinEventHook
+    wintypes.DWORD,  # event
+    wintypes.HWND,  # hwnd
+    wintypes.LONG,  # idObject
+    wintypes.LONG,  # idChild
+    wintypes.DWORD,  # idEventThread
+    wintypes.DWORD,  # dwmsEventTime
+)
+
+_user32 = ctypes.windll.user32
+_user32.SetWinEventHook.argtypes = [
+    wintypes.DWORD,
+    wintypes.DWORD,
+    wintypes.HMODULE,
+    WinEventProc,
+    wintypes.DWORD,
+    wintypes.DWORD,
+    wintypes.DWORD,
+]
+_user32.SetWinEventHook.restype = wintypes.HANDLE
+_user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+_user32.UnhookWinEvent.restype = wintypes.BOOL
+_user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+_user32.GetAncestor.restype = wintypes.HWND
+
+# (min, max) event ranges to hook. LOCATIONCHANGE covers moves, resizes,
+# maximize/restore and snaps that don't go through a move/size loop (caption
+# buttons, Win+Arrow, SetWindowPos); it is noisy (caret, cursor, child
+# windows), so the callback keeps only top-level OBJID_WINDOW events and the
+# service coalesces them into its refresh batch.
+_HOOK_RANGES = (
+    (EVENT_SYSTEM_MOVESIZEEND, EVENT_SYSTEM_MOVESIZEEND),
+    (EVENT_SYSTEM_MINIMIZESTART, EVENT_SYSTEM_MINIMIZEEND),
+    (EVENT_OBJECT_CREATE, EVENT_OBJECT_HIDE),
+    (EVENT_OBJECT_LOCATIONCHANGE, EVENT_OBJECT_NAMECHANGE),
+)
+
+
+class WindowEventListener:
+    """Signals window and display changes from a dedicated message-loop thread."""
+
+    def __init__(self, wake_event: threading.Event):
+        """Initialize the listener.
+
+        Args:
+            wake_event: Event set whenever windows_changed or displays_changed is set
+        """
+        self.logger = logging.getLogger("ScreenAssign.WindowEvents")
+        self.wake_event = wake_event
+        self.windows_changed = threading.Event()
+        self.displays_changed = threading.Event()
+
+        # Top-level windows touched since the last pop_changed_hwnds()
+        self._changed_hwnds: set[int] = set()
+        self._changed_lock = threading.Lock()
+
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._ready = threading.Event()
+        self._active = False
+
+        # Must outlive the hooks, otherwise the callback thunk is freed
+        self._callback = WinEventProc(self._on_win_event)
+
+    @property
+    def active(self) -> bool:
+        """True while the hooks are installed and the message loop is running."""
+        return self._active
+
+    def pop_changed_hwnds(self) -> set[int]:
+        """Return and reset the handles of windows changed since the last call."""
+        with self._changed_lock:
+            changed, self._changed_hwnds = self._changed_hwnds, set()
+        return changed
+
+    def start(self, timeout: float = 2.0) -> bool:
+        """Start the listener thread and wait until the hooks are installed.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish setup
+
+        Returns:
+            bool: True if events will be delivered, False if the caller should poll
+        """
+        if self._thread and self._thread.is_alive():
+            return self._active
+
+        self._ready.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="WindowEventListener", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait(timeout)
+        return self._active
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the message loop and remove the hooks."""
+        if self._thread_id is not None:
+            try:
+                win32api.PostThreadMessage(self._thread_id, win32con.WM_QUIT, 0, 0)
+            except Exception as e:
+                self.logger.debug(f"Could not post WM_QUIT to listener: {e}")
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self):
+        """Thread body: install hooks, create the hidden window, pump messages."""
+        hooks = []
+        hwnd = None
+        class_atom = None
+        try:
+            self._thread_id = win32api.GetCurrentThreadId()
+
+            for event_min, event_max in _HOOK_RANGES:
+                hook = _user32.SetWinEventHook(
+                    event_min,
+                    event_max,
+                    None,
+                    self._callback,
+                    0,
+                    0,
+                    WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+                )
+                if not hook:
+                    raise OSError(
+                        f"SetWinEventHook(0x{event_min:04X}-0x{event_max:04X}) failed"
+                    )
+                hooks.append(hook)
+
+            # Hidden top-level window: message-only windows do not receive the
+            # WM_DISPLAYCHANGE broadcast.
+            wc = win32gui.WNDCLASS()
+            wc.lpszClassName = "BlinkSwitchEventListener"
+            wc.hInstance = win32api.GetModuleHandle(None)
+            wc.lpfnWndProc = {win32con.WM_DISPLAYCHANGE: self._on_display_change}
+            class_atom = win32gui.RegisterClass(wc)
+            hwnd = win32gui.CreateWindowEx(
+                win32con.WS_EX_TOOLWINDOW,
+                class_atom,
+                "BlinkSwitchEventListener",
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                wc.hInstance,
+                None,
+            )
+
+            self._active = True
+            self.logger.info("Window event hooks installed")
+        except Exception as e:
+            self.logger.warning(f"Window event hooks unavailable, polling instead: {e}")
+            for hook in hooks:
+                _user32.UnhookWinEvent(hook)
+            self._thread_id = None
+            self._ready.set()
+            return
+
+        self._ready.set()
+        try:
+            win32gui.PumpMessages()
+        finally:
+            self._active = False
+            for hook in hooks:
+                _user32.UnhookWinEvent(hook)
+            if hwnd:
+                win32gui.DestroyWindow(hwnd)
+            if class_atom:
+                win32gui.UnregisterClass(class_atom, win32api.GetModuleHandle(None))
+            self._thread_id = None
+            # Let a waiting service loop notice it has to fall back to polling
+            self.wake_event.set()
+            self.logger.info("Window event hooks removed")
+
+    def _on_win_event(
+        self, hook, event, hwnd, id_object, id_child, event_thread, event_time
+    ):
+        """WinEvent callback; runs on the listener thread and must stay cheap."""
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+            return
+        # Destroyed windows can no longer be resolved to a root; accept those.
+        if event != EVENT_OBJECT_DESTROY and _user32.GetAncestor(hwnd, GA_ROOT) != hwnd:
+            return
+        with self._changed_lock:
+            self._changed_hwnds.add(hwnd)
+        self.windows_changed.set()
+        self.wake_event.set()
+
+    def _on_display_change(self, hwnd, msg, wparam, lparam):
+        """WM_DISPLAYCHANGE handler for the hidden window."""
+        self.displays_changed.set()
+        # Windows are typically moved/resized along with the displays
+        self.windows_changed.set()
+        self.wake_event.set()
+        return 0
@@ -1,16 +1,20 @@
+import atexit
+import json
 import logging
+import threading
 import win32gui
 import win32con
 import win32api
 import win32process
 import psutil
 import os
+import sys
 import time
 import ctypes
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import wintypes
-from pathlib import Path
 from datetime import datetime
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 from .monitor_manager import MonitorManager
 from .config_manager import ConfigManager
 
@@ -56,22 +60,237 @@ class Input(ctypes.Structure):
     _fields_ = [("type", wintypes.DWORD), ("ii", Input_I)]
 
 
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+_INPUT_SIZE = ctypes.sizeof(Input)
+
+# Resolve SendInput once, with an explicit prototype, instead of going through
+# ctypes.windll and per-call argument conversion on every keystroke.
+try:
+    _SendInput = ctypes.windll.user32.SendInput
+except (AttributeError, OSError):
+    _SendInput = None
+else:
+    _SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(Input), ctypes.c_int]
+    _SendInput.restype = wintypes.UINT
+
+
+def _send_key(hex_key_code, flags):
+    """Send a single keyboard event using SendInput."""
+    # A fresh Input per call keeps this safe to use from several threads;
+    # dwExtraInfo is left NULL.
+    x = Input(INPUT_KEYBOARD)
+    x.ii.ki.wVk = hex_key_code
+    x.ii.ki.dwFlags = flags
+    _SendInput(1, ctypes.byref(x), _INPUT_SIZE)
+
+
 def _press_key(hex_key_code):
     """Press a key using SendInput."""
-    extra = ctypes.c_ulong(0)
-    ii_ = Input_I()
-    ii_.ki = KeyBdInput(hex_key_code, 0, 0, 0, ctypes.pointer(extra))
-    x = Input(ctypes.c_ulong(1), ii_)
-    ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+    _send_key(hex_key_code, 0)
 
 
 def _release_key(hex_key_code):
     """Release a key using SendInput."""
-    extra = ctypes.c_ulong(0)
-    ii_ = Input_I()
-    ii_.ki = KeyBdInput(hex_key_code, 0, 0x0002, 0, ctypes.pointer(extra))
-    x = Input(ctypes.c_ulong(1), ii_)
-    ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+    _send_key(hex_key_code, KEYEVENTF_KEYUP)
+
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+# Process queries for the per-window pid -> exe path lookup; one limited
+# handle answers both the create time (cache key) and the image name.
+try:
+    _kernel32 = ctypes.windll.kernel32
+except (AttributeError, OSError):
+    _kernel32 = None
+else:
+    _kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.GetProcessTimes.argtypes = [wintypes.HANDLE] + [
+        ctypes.POINTER(wintypes.FILETIME)
+    ] * 4
+    _kernel32.GetProcessTimes.restype = wintypes.BOOL
+    _kernel32.QueryFullProcessImageNameW.argtypes = [
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.LPWSTR,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    _kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+
+def _process_create_time(hproc) -> int | None:
+    """Return a process's creation time as a FILETIME integer, or None."""
+    creation = wintypes.FILETIME()
+    unused = wintypes.FILETIME()
+    if not _kernel32.GetProcessTimes(
+        hproc,
+        ctypes.byref(creation),
+        ctypes.byref(unused),
+        ctypes.byref(unused),
+        ctypes.byref(unused),
+    ):
+        return None
+    return (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+
+
+def _process_image_name(hproc) -> str | None:
+    """Return a process's full exe path via QueryFullProcessImageNameW, or None."""
+    # Per call rather than shared: window info is collected on several threads
+    buf = ctypes.create_unicode_buffer(1024)
+    size = wintypes.DWORD(len(buf))
+    if not _kernel32.QueryFullProcessImageNameW(hproc, 0, buf, ctypes.byref(size)):
+        return None
+    return buf.value or None
+
+
+# Wide-char class name/title reads into a per-thread scratch buffer, instead of
+# pywin32 allocating a buffer per call. Window info is built on worker threads,
+# hence thread-local rather than shared.
+_SCRATCH_CHARS = 1024
+_scratch = threading.local()
+
+try:
+    _user32 = ctypes.windll.user32
+except (AttributeError, OSError):
+    _user32 = None
+else:
+    for _fn in (_user32.GetClassNameW, _user32.GetWindowTextW):
+        _fn.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        _fn.restype = ctypes.c_int
+    # Unsigned return: styles need no sign fix-up
+    _user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _user32.GetWindowLongW.restype = wintypes.DWORD
+
+
+def _scratch_buffer():
+    """Return this thread's reusable wide-char buffer."""
+    buf = getattr(_scratch, "buf", None)
+    if buf is None:
+        buf = _scratch.buf = ctypes.create_unicode_buffer(_SCRATCH_CHARS)
+    return buf
+
+
+def _window_class_name(hwnd) -> str:
+    """GetClassNameW into the scratch buffer; raises OSError on failure."""
+    if _user32 is None:
+        return win32gui.GetClassName(hwnd)
+    buf = _scratch_buffer()
+    n = _user32.GetClassNameW(hwnd, buf, _SCRATCH_CHARS)
+    if not n:
+        raise OSError(f"GetClassNameW failed for hwnd={hwnd}")
+    return buf[:n]
+
+
+def _window_style(hwnd) -> int:
+    """GWL_STYLE as an unsigned 32-bit value."""
+    if _user32 is None:
+        return win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE) & 0xFFFFFFFF
+    return _user32.GetWindowLongW(hwnd, win32con.GWL_STYLE)
+
+
+def _window_text(hwnd) -> str:
+    """GetWindowTextW into the scratch buffer (pywin32 for very long titles)."""
+    if _user32 is None:
+        return win32gui.GetWindowText(hwnd)
+    buf = _scratch_buffer()
+    n = _user32.GetWindowTextW(hwnd, buf, _SCRATCH_CHARS)
+    if n >= _SCRATCH_CHARS - 1:
+        # Possibly truncated
+        return win32gui.GetWindowText(hwnd)
+    return buf[:n]
+
+
+SWP_NOZORDER = 0x0004
+SWP_NOACTIVATE = 0x0010
+SWP_NOSENDCHANGING = 0x0400
+SWP_ASYNCWINDOWPOS = 0x4000
+
+# Flags for rule moves. NOSENDCHANGING skips the WM_WINDOWPOSCHANGING round
+# trip into the target app; the rect is the whole monitor and maximize follows.
+_MOVE_FLAGS = SWP_NOZORDER | SWP_NOACTIVATE | SWP_NOSENDCHANGING
+# Standalone moves also don't wait for the window's thread to process them
+# (DeferWindowPos doesn't accept SWP_ASYNCWINDOWPOS)
+_ASYNC_MOVE_FLAGS = _MOVE_FLAGS | SWP_ASYNCWINDOWPOS
+
+
+class _RulePlan(NamedTuple):
+    """Pending rule application for one window (see _apply_window_rules)."""
+
+    index: int
+    hwnd: int
+    title: str
+    monitor_id: str
+    monitor: Any
+    maximize: bool
+    skip_popups: bool
+    needs_move: bool
+    current_maximized: bool
+    operations: list
+
+
+class DeferredPositionBatch:
+    """Collects window moves and applies them in one DeferWindowPos batch.
+
+    Windows are repositioned together by EndDeferWindowPos instead of one
+    MoveWindow round trip each. If the batch cannot be built (e.g. a window
+    was destroyed meanwhile) the moves fall back to individual asynchronous
+    SetWindowPos calls. Used as a context manager; the moves are applied on exit.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self._moves: list[tuple[int, int, int, int, int]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+    def move(self, hwnd: int, x: int, y: int, width: int, height: int) -> None:
+        """Queue a move/resize (same effect as MoveWindow(..., True))."""
+        self._moves.append((hwnd, x, y, width, height))
+
+    def flush(self) -> None:
+        """Apply all queued moves."""
+        moves, self._moves = self._moves, []
+        if not moves:
+            return
+        try:
+            hdwp = win32gui.BeginDeferWindowPos(len(moves))
+            for hwnd, x, y, width, height in moves:
+                hdwp = win32gui.DeferWindowPos(
+                    hdwp, hwnd, 0, x, y, width, height, _MOVE_FLAGS
+                )
+            win32gui.EndDeferWindowPos(hdwp)
+            return
+        except Exception as e:
+            self.logger.debug(f"DeferWindowPos batch failed, moving one by one: {e}")
+
+        for hwnd, x, y, width, height in moves:
+            try:
+                win32gui.SetWindowPos(hwnd, 0, x, y, width, height, _ASYNC_MOVE_FLAGS)
+            except Exception as e:
+                self.logger.warning(f"Could not move hwnd={hwnd}: {e}")
+
+
+def _norm_exe(s: str | None) -> str:
+    """Normalize an exe name for rule matching: lowercase, with ".exe"."""
+    s = (s or "").strip().lower()
+    return s if s.endswith(".exe") else (s + ".exe" if s else s)
+
+
+def _interned_set(names) -> frozenset[str]:
+    """Return a frozenset of the interned names.
+
+    Class and exe names are interned when read, so lookups in these sets
+    match by identity before any string comparison.
+    """
+    return frozenset(map(sys.intern, names))
 
 
 class WindowManager:
@@ -104,60 +323,96 @@ class WindowManager:
 
         # Classification (we tag; we don't hide).
         # These sets are intentionally conservative; add more as you observe windows in the wild.
-        self.system_classnames = {
-            "Progman",  # Desktop
-            "WorkerW",  # Desktop background host
-            "Shell_TrayWnd",  # Taskbar
-            "Shell_SecondaryTrayWnd",  # Secondary taskbar
-        }
-        self.system_titles = {
-            "Program Manager",
-        }
-        self.system_process_names = {
-            "SystemSettings.exe",
-            "SearchUI.exe",
-            "StartMenuExperienceHost.exe",
-            "ShellExperienceHost.exe",
-            "RuntimeBroker.exe",
-            "dwm.exe",
-            "sihost.exe",
-            "ctfmon.exe",
-            "taskhostw.exe",
-        }
+        # Frozen: looked up for every window and never modified at runtime.
+        self.system_classnames = _interned_set(
+            {
+                "Progman",  # Desktop
+                "WorkerW",  # Desktop background host
+                "Shell_TrayWnd",  # Taskbar
+                "Shell_SecondaryTrayWnd",  # Secondary taskbar
+            }
+        )
+        self.system_titles = frozenset(
+            {
+                "Program Manager",
+            }
+        )
+        self.system_process_names = _interned_set(
+            {
+                "SystemSettings.exe",
+                "SearchUI.exe",
+                "StartMenuExperienceHost.exe",
+                "ShellExperienceHost.exe",
+                "RuntimeBroker.exe",
+                "dwm.exe",
+                "sihost.exe",
+                "ctfmon.exe",
+                "taskhostw.exe",
+            }
+        )
 
         # WinSwitcher-style excluded windows (applies to the window list only; rules still act
         # only on matched windows).
         # NOTE: do not include ApplicationFrameHost.exe (keep UWP visible).
-        self.excluded_window_filenames = {
-            "SystemSettings.exe",
-            "TextInputHost.exe",
-            "HxOutlook.exe",
-            "ShellExperienceHost.exe",
-        }
+        self.excluded_window_filenames = _interned_set(
+            {
+                "SystemSettings.exe",
+                "TextInputHost.exe",
+                "HxOutlook.exe",
+                "ShellExperienceHost.exe",
+            }
+        )
 
         # Cache for expensive per-exe lookups (e.g. version info FileDescription)
         self._app_display_name_cache: dict[str, str] = {}
 
-    def _get_window_rect(self, hwnd: int):
-        try:
-            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-            return left, top, right - left, bottom - top
-        except Exception:
-            return 0, 0, 0, 0
+        # (class_name, exe_name) -> (is_system, is_uwp), see _classify_app()
+        self._app_class_cache: dict[
+            tuple[str | None, str | None], tuple[bool, bool]
+        ] = {}
+
+        # pid -> (process create time, exe path); the create time guards
+        # against pid reuse
+        self._pid_path_cache: dict[int, tuple[float, str | None]] = {}
+
+        # Handles of the window switcher's own windows, registered by the
+        # frontend; skipped before any per-window query
+        self._ignored_hwnds: set[int] = set()
+
+        # Workers for get_all_windows and rule application; see _get_executor()
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Last get_all_windows result as (time.monotonic(), windows); reused for
+        # snapshot_ttl_ms and dropped whenever this manager moves a window
+        self.snapshot_ttl_ms = 150
+        self._last_snapshot: tuple[float, list[dict]] | None = None
+
+        # (windows, index) for the last caller-supplied window list; see
+        # _index_windows()
+        self._rule_index: tuple | None = None
+
+        # Version-resource results persisted across restarts, validated by the
+        # exe's mtime and size: {process_path: [mtime, size, display_name]}
+        self._display_names_path = os.path.join(
+            self.config_manager.config_dir, "display_names.json"
+        )
+        self._persisted_display_names = self._load_display_names()
+        self._display_names_dirty = False
+        self._display_names_saved_at = time.monotonic()
+        self._display_names_lock = threading.Lock()
+        atexit.register(self.save_display_names)
 
     def _enum_top_level_windows(self) -> list[int]:
         hwnds: list[int] = []
+        append = hwnds.append
+        is_visible = win32gui.IsWindowVisible
 
         def _cb(hwnd, lparam):
+            # EnumWindows only reports existing top-level windows, so an
+            # IsWindow check here is redundant; filter on visibility only.
             try:
-                # Only consider real top-level windows
-                if not win32gui.IsWindow(hwnd):
-                    return True
-
-                if not win32gui.IsWindowVisible(hwnd):
-                    return True
-
-                hwnds.append(hwnd)
+                if is_visible(hwnd):
+                    append(hwnd)
             except Exception:
                 # Keep enumeration resilient
                 pass
@@ -166,77 +421,187 @@ class WindowManager:
         win32gui.EnumWindows(_cb, None)
         return hwnds
 
-    def get_all_windows(self):
+    def get_all_windows(self, force=False):
         """Get all visible windows.
 
+        Per-window lookups are mostly blocking Win32/psutil calls that release
+        the GIL, so they run on a small thread pool; the result keeps the
+        EnumWindows (z-)order. A result younger than snapshot_ttl_ms is
+        reused; the window dicts are shared with other callers.
+
+        Args:
+            force (bool): Always enumerate, ignoring the recent snapshot
+
         Returns:
             list: List of window information dictionaries
         """
-        windows: list[dict] = []
+        snapshot = self._last_snapshot
+        if (
+            not force
+            and snapshot is not None
+            and (time.monotonic() - snapshot[0]) * 1000 < self.snapshot_ttl_ms
+        ):
+            return list(snapshot[1])
+
+        started = time.monotonic()
+        if self._ignored_hwnds:
+            self._prune_ignored_hwnds()
+        hwnds = self._enum_top_level_windows()
+        windows = [
+            window_info
+            for window_info in self._get_executor().map(self.get_window_info, hwnds)
+            if window_info is not None
+        ]
+        self._last_snapshot = (started, windows)
+        return list(windows)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Worker pool for per-window Win32 calls; created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="WindowWorker"
+            )
+        return self._executor
 
-        for hwnd in self._enum_top_level_windows():
-            try:
-                title = win32gui.GetWindowText(hwnd)
-                class_name = self.get_window_class(hwnd)
+    def refresh(self):
+        """Drop the get_all_windows snapshot so the next call re-enumerates."""
+        self._last_snapshot = None
 
-                is_minimized = False
-                try:
-                    is_minimized = bool(win32gui.IsIconic(hwnd))
-                except Exception:
-                    is_minimized = False
+    def register_switcher_hwnd(self, hwnd: int) -> None:
+        """Exclude one of the window switcher's own windows from the window list.
 
-                pid = self.get_window_pid(hwnd)
-                process_path = self.get_process_path_from_pid(pid)
-                exe_name = self._exe_name_from_path(process_path)
+        Args:
+            hwnd: Window handle of the switcher window
+        """
+        if hwnd not in self._ignored_hwnds:
+            self._prune_ignored_hwnds()
+            self._ignored_hwnds.add(hwnd)
+            self.refresh()
 
-                is_uwp = self.is_uwp_window(class_name=class_name, exe_name=exe_name)
-                is_system = self.is_system_window(
-                    title=title, class_name=class_name, exe_name=exe_name
-                )
+    def unregister_switcher_hwnd(self, hwnd: int) -> None:
+        """Undo register_switcher_hwnd().
 
-                # Exclude the Window Switcher itself by unique marker
-                if "__SCREENY_WINDOW_SWITCHER_UNIQUE_MARKER__" in title:
-                    continue
+        Args:
+            hwnd: Window handle of the switcher window
+        """
+        if hwnd in self._ignored_hwnds:
+            self._ignored_hwnds.discard(hwnd)
+            self.refresh()
 
-                # WinSwitcher: exclude some known junk windows by exe filename.
-                if exe_name and exe_name in self.excluded_window_filenames:
-                    continue
+    def _prune_ignored_hwnds(self) -> None:
+        """Forget registered switcher handles whose window no longer exists.
 
-                # WinSwitcher behavior: ignore empty-title windows.
-                # Exception: keep system windows even if title is empty so they can be targeted by rules.
-                if not (title and title.strip()):
-                    if not is_system:
-                        continue
+        A switcher that is killed never unregisters; its handle would stay
+        skipped for good and hide an unrelated window if Windows hands the
+        same value out again.
+        """
+        dead = [
+            hwnd for hwnd in tuple(self._ignored_hwnds) if not win32gui.IsWindow(hwnd)
+        ]
+        for hwnd in dead:
+            self._ignored_hwnds.discard(hwnd)
+        if dead:
+            self.logger.debug(f"Dropped {len(dead)} stale switcher window handle(s)")
 
-                left, top, width, height = self._get_window_rect(hwnd)
+    def get_window_info(self, hwnd: int, check_visible: bool = False) -> dict | None:
+        """Build the window list entry for a single top-level window.
 
+        Args:
+            hwnd: Window handle
+            check_visible: Also apply the enumeration filter (window still
+                exists and is visible); used for per-window cache updates
+
+        Returns:
+            dict | None: Window information, or None if the window is gone or
+                excluded from the window list
+        """
+        # Known switcher windows: skip without any Win32 call
+        if hwnd in self._ignored_hwnds:
+            return None
+
+        try:
+            if check_visible and not (
+                win32gui.IsWindow(hwnd) and win32gui.IsWindowVisible(hwnd)
+            ):
+                return None
+
+            # The exe (cached per process) decides exclusion, so excluded
+            # windows are dropped before any other per-window query.
+            pid = self.get_window_pid(hwnd)
+            process_path = self.get_process_path_from_pid(pid)
+            exe_name = self._exe_name_from_path(process_path)
+
+            # WinSwitcher: exclude some known junk windows by exe filename.
+            if exe_name and exe_name in self.excluded_window_filenames:
+                return None
+
+            title = _window_text(hwnd)
+
+            # Exclude the Window Switcher itself by unique marker (covers
+            # switcher windows that were not registered by hwnd)
+            if "__SCREENY_WINDOW_SWITCHER_UNIQUE_MARKER__" in title:
+                return None
+
+            class_name = self.get_window_class(hwnd)
+
+            is_system_app, is_uwp = self._classify_app(class_name, exe_name)
+            is_system = is_system_app or bool(
+                title and title.strip() in self.system_titles
+            )
+
+            # WinSwitcher behavior: ignore empty-title windows.
+            # Exception: keep system windows even if title is empty so they can be targeted by rules.
+            if not (title and title.strip()):
+                if not is_system:
+                    return None
+
+            # One GetWindowRect and one GetWindowPlacement per window; the
+            # position, monitor and min/max state are all derived from them
+            try:
+                rect = win32gui.GetWindowRect(hwnd)
+            except Exception:
+                rect = None
+            if rect is not None:
+                left, top, right, bottom = rect
+                monitor_id = self.get_window_monitor_id(hwnd, rect)
+            else:
+                left, top, right, bottom = 0, 0, 0, 0
+                monitor_id = None
+
+            try:
+                show_cmd = win32gui.GetWindowPlacement(hwnd)[1]
+            except Exception:
+                show_cmd = None
+
+            # System windows are hidden by the switcher UI; the exe name is
+            # enough for them and skips the version-resource lookup
+            if is_system:
+                app_display_name = exe_name
+            else:
                 app_display_name = self.get_app_display_name(process_path)
 
-                window_info = {
-                    "hwnd": hwnd,
-                    "title": title,
-                    # Backwards-compatible field used by rules/UI; make it stable (exe name).
-                    "app_name": exe_name,
-                    "class_name": class_name,
-                    "pid": pid,
-                    "process_path": process_path,
-                    "exe_name": exe_name,
-                    "app_display_name": app_display_name,
-                    "is_system": is_system,
-                    "is_uwp": is_uwp,
-                    "is_minimized": is_minimized,
-                    "position": (left, top, width, height),
-                    "is_maximized": self.is_window_maximized(hwnd),
-                    "monitor_id": self.get_window_monitor_id(hwnd),
-                }
-
-                windows.append(window_info)
-            except Exception as e:
-                self.logger.debug(
-                    f"Error getting window info for hwnd={hwnd}: {str(e)}"
-                )
+            window_info = {
+                "hwnd": hwnd,
+                "title": title,
+                # Backwards-compatible field used by rules/UI; make it stable (exe name).
+                "app_name": exe_name,
+                "class_name": class_name,
+                "pid": pid,
+                "process_path": process_path,
+                "exe_name": exe_name,
+                "app_display_name": app_display_name,
+                "is_system": is_system,
+                "is_uwp": is_uwp,
+                "is_minimized": show_cmd == win32con.SW_SHOWMINIMIZED,
+                "position": (left, top, right - left, bottom - top),
+                "is_maximized": show_cmd == win32con.SW_SHOWMAXIMIZED,
+                "monitor_id": monitor_id,
+            }
 
-        return windows
+            return window_info
+        except Exception as e:
+            self.logger.debug(f"Error getting window info for hwnd={hwnd}: {str(e)}")
+            return None
 
     def get_window_pid(self, hwnd: int) -> int | None:
         try:
@@ -246,10 +611,71 @@ class WindowManager:
             return None
 
     def get_process_path_from_pid(self, pid: int | None) -> str | None:
+        """Get a process's exe path, cached per (pid, process create time).
+
+        Uses a single PROCESS_QUERY_LIMITED_INFORMATION handle for both the
+        create time and the image name; psutil is only the fallback for
+        processes that handle can't be opened for.
+        """
         if not pid:
             return None
+
+        hproc = (
+            _kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if _kernel32 is not None
+            else None
+        )
+        if not hproc:
+            return self._process_path_via_psutil(pid)
+
+        try:
+            create_time = _process_create_time(hproc)
+            cached = self._pid_path_cache.get(pid)
+            if (
+                create_time is not None
+                and cached is not None
+                and cached[0] == create_time
+            ):
+                return cached[1]
+            path = _process_image_name(hproc) or self._query_process_path(pid, None)
+        finally:
+            _kernel32.CloseHandle(hproc)
+
+        if create_time is not None:
+            self._store_process_path(pid, create_time, path)
+        return path
+
+    def _process_path_via_psutil(self, pid: int) -> str | None:
+        """Cached pid -> exe path lookup keyed on psutil's create time."""
+        try:
+            proc = psutil.Process(pid)
+            create_time = proc.create_time()
+        except psutil.NoSuchProcess:
+            self._pid_path_cache.pop(pid, None)
+            return None
+        except Exception:
+            return self._query_process_path(pid, None)
+
+        cached = self._pid_path_cache.get(pid)
+        if cached is not None and cached[0] == create_time:
+            return cached[1]
+
+        path = self._query_process_path(pid, proc)
+        self._store_process_path(pid, create_time, path)
+        return path
+
+    def _store_process_path(
+        self, pid: int, create_time: float, path: str | None
+    ) -> None:
+        if len(self._pid_path_cache) >= 1024:
+            # Entries of exited processes are never evicted otherwise
+            self._pid_path_cache.clear()
+        self._pid_path_cache[pid] = (create_time, path)
+
+    def _query_process_path(self, pid: int, proc: psutil.Process | None) -> str | None:
+        """Look up a process's exe path (uncached)."""
         try:
-            return psutil.Process(pid).exe()
+            return (proc or psutil.Process(pid)).exe()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
         except Exception:
@@ -273,16 +699,67 @@ class WindowManager:
     def _exe_name_from_path(self, process_path: str | None) -> str | None:
         if not process_path:
             return None
+        # Interned: a few dozen exe names are repeated across every window
+        # dict, and set/dict lookups on them can short-circuit on identity.
+        # Plain string splitting; no Path object per window.
+        return sys.intern(process_path.rpartition("\\")[2].rpartition("/")[2])
+
+    def _load_display_names(self) -> dict[str, list]:
+        """Load the persisted display-name cache; returns {} if missing or invalid."""
         try:
-            return Path(process_path).name
-        except Exception:
-            return os.path.basename(process_path)
+            with open(self._display_names_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring display name cache: {e}")
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+        return {
+            path: entry
+            for path, entry in data.items()
+            if isinstance(entry, list) and len(entry) == 3
+        }
+
+    def save_display_names(self, min_interval_s: float = 0.0) -> None:
+        """Write the display-name cache to disk if it changed.
+
+        Args:
+            min_interval_s: Skip the write if the last one is more recent than this
+        """
+        # get_all_windows calls this from several worker threads
+        with self._display_names_lock:
+            if not self._display_names_dirty:
+                return
+            if time.monotonic() - self._display_names_saved_at < min_interval_s:
+                return
+            # Written to a temp file that is fsynced and swapped in with
+            # os.replace, so a crash mid-write can't leave truncated JSON
+            payload = json.dumps(dict(self._persisted_display_names)).encode("utf-8")
+            tmp_path = self._display_names_path + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self._display_names_path)
+                self._display_names_dirty = False
+            except Exception as e:
+                self.logger.warning(f"Could not save display name cache: {e}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            self._display_names_saved_at = time.monotonic()
 
     def get_app_display_name(self, process_path: str | None) -> str | None:
         """Best-effort human name for an exe.
 
         Uses the Windows version resource FileDescription when available, otherwise
-        falls back to the exe filename.
+        falls back to the exe filename. Results are cached in memory and on disk;
+        the disk entry is reused while the exe's mtime and size are unchanged.
         """
         if not process_path:
             return None
@@ -291,6 +768,18 @@ class WindowManager:
         if cached is not None:
             return cached
 
+        try:
+            st = os.stat(process_path)
+            stamp = [st.st_mtime, st.st_size]
+        except OSError:
+            stamp = None
+
+        persisted = self._persisted_display_names.get(process_path)
+        if stamp is not None and persisted is not None and persisted[:2] == stamp:
+            title_str = str(persisted[2])
+            self._app_display_name_cache[process_path] = title_str
+            return title_str
+
         title: str | None = None
         try:
             langs_any: Any = win32api.GetFileVersionInfo(
@@ -314,6 +803,13 @@ class WindowManager:
         # Ensure cache always stores a string
         title_str = str(title)
         self._app_display_name_cache[process_path] = title_str
+        if stamp is not None:
+            # Under the lock so a concurrent save can't mark this entry clean
+            # before it has been written
+            with self._display_names_lock:
+                self._persisted_display_names[process_path] = [*stamp, title_str]
+                self._display_names_dirty = True
+            self.save_display_names(min_interval_s=30.0)
         return title_str
 
     def is_system_window(
@@ -322,18 +818,38 @@ class WindowManager:
         t = (title or "").strip()
         if t and t in self.system_titles:
             return True
-        if class_name and class_name in self.system_classnames:
-            return True
-        if exe_name and exe_name in self.system_process_names:
-            return True
-        return False
+        return self._classify_app(class_name, exe_name)[0]
 
     def is_uwp_window(self, class_name: str | None, exe_name: str | None) -> bool:
-        if class_name in {"ApplicationFrameWindow", "Windows.UI.Core.CoreWindow"}:
-            return True
-        if exe_name and exe_name.lower() == "applicationframehost.exe":
-            return True
-        return False
+        return self._classify_app(class_name, exe_name)[1]
+
+    def _classify_app(
+        self, class_name: str | None, exe_name: str | None
+    ) -> tuple[bool, bool]:
+        """Return (is_system, is_uwp) as decided by class and exe name alone.
+
+        The answer depends only on the pair, which repeats for every window
+        of an app, so it is computed once per pair. The title-based system
+        check is not included since titles change.
+        """
+        key = (class_name, exe_name)
+        cached = self._app_class_cache.get(key)
+        if cached is not None:
+            return cached
+
+        is_system = bool(
+            (class_name and class_name in self.system_classnames)
+            or (exe_name and exe_name in self.system_process_names)
+        )
+        is_uwp = class_name in {
+            "ApplicationFrameWindow",
+            "Windows.UI.Core.CoreWindow",
+        } or bool(exe_name and exe_name.lower() == "applicationframehost.exe")
+
+        if len(self._app_class_cache) >= 1024:
+            self._app_class_cache.clear()
+        self._app_class_cache[key] = (is_system, is_uwp)
+        return is_system, is_uwp
 
     def get_window_class(self, hwnd):
         """Get the window class name.
@@ -345,7 +861,8 @@ class WindowManager:
             str: Window class name or None on error
         """
         try:
-            return win32gui.GetClassName(hwnd)
+            # Interned for the same reason as exe names (_exe_name_from_path)
+            return sys.intern(_window_class_name(hwnd))
         except Exception:
             return None
 
@@ -363,26 +880,15 @@ class WindowManager:
             if not pid:
                 return None
 
+            # Cached per process; already falls back to GetModuleFileNameEx
+            process_path = self.get_process_path_from_pid(pid)
+            if process_path:
+                return os.path.basename(process_path)
+
+            # Protected processes: the name is readable even when the path isn't
             try:
                 return psutil.Process(pid).name()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-            # Fallback: ask Windows for the module filename
-            try:
-                hproc = win32api.OpenProcess(
-                    win32con.PROCESS_QUERY_LIMITED_INFORMATION
-                    | win32con.PROCESS_VM_READ,
-                    False,
-                    pid,
-                )
-                try:
-                    exe_path = win32process.GetModuleFileNameEx(hproc, 0)
-                    if exe_path:
-                        return os.path.basename(exe_path)
-                finally:
-                    win32api.CloseHandle(hproc)
-            except Exception:
                 return None
         except Exception as e:
             self.logger.debug(f"Failed to get process name from window handle: {e}")
@@ -403,17 +909,20 @@ class WindowManager:
         except Exception:
             return False
 
-    def get_window_monitor_id(self, hwnd):
+    def get_window_monitor_id(self, hwnd, rect=None):
         """Get the ID of the monitor containing a window.
 
         Args:
             hwnd (int): Window handle
+            rect (tuple, optional): Window rect (left, top, right, bottom) if
+                already known; avoids another GetWindowRect call
 
         Returns:
             str: Monitor ID or None if not found
         """
         try:
-            rect = win32gui.GetWindowRect(hwnd)
+            if rect is None:
+                rect = win32gui.GetWindowRect(hwnd)
             window_center_x = (rect[0] + rect[2]) // 2
             window_center_y = (rect[1] + rect[3]) // 2
 
@@ -423,17 +932,19 @@ class WindowManager:
         except Exception:
             return None
 
-    def is_window_on_monitor(self, hwnd, monitor_id):
+    def is_window_on_monitor(self, hwnd, monitor_id, rect=None):
         """Check if window is on the specified monitor.
 
         Args:
             hwnd (int): Window handle
             monitor_id (str): Target monitor ID
+            rect (tuple, optional): Window rect (left, top, right, bottom) if
+                already known
 
         Returns:
             bool: True if window is on target monitor
         """
-        current_monitor_id = self.get_window_monitor_id(hwnd)
+        current_monitor_id = self.get_window_monitor_id(hwnd, rect)
         return current_monitor_id == monitor_id
 
     def is_window_in_correct_state(
@@ -476,6 +987,7 @@ class WindowManager:
             self.logger.warning(f"Monitor {monitor_id} is not connected")
             return False
 
+        self.refresh()
         if maximize:
             self.move_and_maximize_window(hwnd, monitor)
         else:
@@ -499,6 +1011,8 @@ class WindowManager:
             hwnd (int): Window handle
             monitor: Monitor object
         """
+        self.refresh()
+
         # First restore the window to clear any weird maximized state
         # (e.g., if user accidentally moved a maximized window)
         win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
@@ -518,32 +1032,45 @@ class WindowManager:
     def move_window(self, hwnd, monitor):
         """Move window to target monitor (restores first if maximized).
 
+        The move is posted asynchronously (SWP_ASYNCWINDOWPOS); callers that
+        need the window in place should wait for it to arrive.
+
         Args:
             hwnd (int): Window handle
             monitor: Monitor object with x, y, width, height
         """
         window_title = win32gui.GetWindowText(hwnd)
+        self.refresh()
 
         # Restore window first (clears maximized state)
         win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
 
         # Move to monitor - use full monitor size for clean positioning
-        win32gui.MoveWindow(
-            hwnd, monitor.x, monitor.y, monitor.width, monitor.height, True
+        win32gui.SetWindowPos(
+            hwnd,
+            0,
+            monitor.x,
+            monitor.y,
+            monitor.width,
+            monitor.height,
+            _ASYNC_MOVE_FLAGS,
         )
 
         self.logger.info(
             f"Moved '{window_title}' to monitor at ({monitor.x}, {monitor.y})"
         )
 
-    def maximize_window(self, hwnd, monitor):
+    def maximize_window(self, hwnd, monitor, window_title=None):
         """Maximize window on specified monitor.
 
         Args:
             hwnd (int): Window handle
             monitor: Monitor object (for logging/verification)
+            window_title (str, optional): Title for the log line, if already known
         """
-        window_title = win32gui.GetWindowText(hwnd)
+        if window_title is None:
+            window_title = win32gui.GetWindowText(hwnd)
+        self.refresh()
         win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
         self.logger.info(f"Maximized '{window_title}'")
 
@@ -564,59 +1091,223 @@ class WindowManager:
                 - 'changed' (bool): True if any operations were performed
                 - 'operations' (list): List of operations performed (e.g., ['move', 'maximize'])
         """
-        window_title = win32gui.GetWindowText(hwnd)
-        monitor = self.monitor_manager.get_connected_monitor(monitor_id)
+        target = (hwnd, monitor_id, maximize, skip_popups)
+        result = self._apply_window_rules([target])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-        if not monitor:
-            self.logger.warning(f"Monitor {monitor_id} not connected")
-            return {"changed": False, "operations": []}
+    def _apply_window_rules(self, targets):
+        """Apply positioning rules to several windows, batching the moves.
+
+        Works like apply_window_rule() for each target, but all moves are
+        applied in one DeferWindowPos batch and share a single settle wait,
+        instead of one MoveWindow + 0.3 s sleep per window.
+
+        Args:
+            targets (list): (hwnd, monitor_id, maximize, skip_popups) tuples
+
+        Returns:
+            list: Per target, in order, the apply_window_rule() result dict or
+                the exception raised while handling that window
+        """
+        results: list = [None] * len(targets)
+        plans: list[_RulePlan] = []
+
+        # Step 0: Read the current monitor and maximize state once per window
+        for index, (hwnd, monitor_id, maximize, skip_popups) in enumerate(targets):
+            try:
+                monitor = self.monitor_manager.get_connected_monitor(monitor_id)
+
+                if not monitor:
+                    self.logger.warning(f"Monitor {monitor_id} not connected")
+                    results[index] = {"changed": False, "operations": []}
+                    continue
 
-        # Check if already in correct state
-        if self.is_window_in_correct_state(hwnd, monitor_id, monitor, maximize):
+                needs_move = not self.is_window_on_monitor(hwnd, monitor_id)
+                # A moved window is restored first and its state re-read
+                # afterwards, so the maximize probe only matters if it stays
+                current_maximized = not needs_move and self.is_window_maximized(hwnd)
+
+                # Check if already in correct state; the title is only needed
+                # for logging, so the steady-state path doesn't read it
+                if not needs_move and current_maximized == bool(maximize):
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            f"Window '{_window_text(hwnd)}' already in correct "
+                            "state, skipping"
+                        )
+                    results[index] = {"changed": False, "operations": []}
+                    continue
+
+                window_title = _window_text(hwnd)
+
+                plans.append(
+                    _RulePlan(
+                        index,
+                        hwnd,
+                        window_title,
+                        monitor_id,
+                        monitor,
+                        maximize,
+                        skip_popups,
+                        needs_move,
+                        current_maximized,
+                        [],
+                    )
+                )
+            except Exception as e:
+                results[index] = e
+
+        # Step 1: Move windows to their target monitors (restores first)
+        movers = [plan for plan in plans if plan.needs_move]
+        if movers:
+            self.refresh()
+            for plan in movers:
+                self.logger.info(f"Moving '{plan.title}' to monitor {plan.monitor_id}")
+
+            # Restore windows first (clears maximized state)
+            restored = self._run_per_window(
+                lambda plan: win32gui.ShowWindow(plan.hwnd, win32con.SW_RESTORE),
+                movers,
+            )
+            failed = set()
+            for plan, outcome in zip(movers, restored):
+                if isinstance(outcome, Exception):
+                    results[plan.index] = outcome
+                    failed.add(plan.index)
+            if failed:
+                plans = [plan for plan in plans if plan.index not in failed]
+                movers = [plan for plan in movers if plan.index not in failed]
+
+            # Use full monitor size for clean positioning
+            with DeferredPositionBatch(self.logger) as batch:
+                for plan in movers:
+                    monitor = plan.monitor
+                    batch.move(
+                        plan.hwnd, monitor.x, monitor.y, monitor.width, monitor.height
+                    )
+                    plan.operations.append("move")
+
+            for plan in movers:
+                self.logger.info(
+                    f"Moved '{plan.title}' to monitor at "
+                    f"({plan.monitor.x}, {plan.monitor.y})"
+                )
+            self._wait_for_moves(movers, timeout=0.3)  # Let moves settle
+
+        # Step 2: Apply maximize / normal state
+        finished = self._run_per_window(self._finish_window_rule, plans)
+        for plan, outcome in zip(plans, finished):
+            results[plan.index] = outcome
+
+        return results
+
+    def _wait_for_moves(self, plans, timeout: float) -> None:
+        """Wait until moved windows report their target monitor, up to timeout.
+
+        Replaces a fixed settle sleep: windows that process the move right
+        away (most of them) end the wait after the first check, while a slow
+        one still gets the full timeout before it is maximized. The poll
+        interval starts at 10 ms and doubles, so a slow window isn't probed
+        every 10 ms for the whole timeout.
+
+        Args:
+            plans (list): _RulePlan entries of the moved windows
+            timeout (float): Maximum wait in seconds
+        """
+        deadline = time.monotonic() + timeout
+        pending = list(plans)
+        delay = 0.01
+        while True:
+            pending = [
+                plan
+                for plan in pending
+                if not self.is_window_on_monitor(plan.hwnd, plan.monitor_id)
+            ]
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.08)
+
+        if pending:
             self.logger.debug(
-                f"Window '{window_title}' already in correct state, skipping"
+                f"{len(pending)} window(s) not on target monitor after {timeout}s"
             )
-            return {"changed": False, "operations": []}
 
-        operations = []
+    def _finish_window_rule(self, plan: _RulePlan) -> dict:
+        """Apply the maximize / normal state step of a window rule.
 
-        # Step 1: Check if window needs to move to different monitor
-        needs_move = not self.is_window_on_monitor(hwnd, monitor_id)
+        Args:
+            plan: The window's pending rule application
 
-        if needs_move:
-            self.logger.info(f"Moving '{window_title}' to monitor {monitor_id}")
-            self.move_window(hwnd, monitor)
-            operations.append("move")
-            time.sleep(0.3)  # Let move settle
+        Returns:
+            dict: apply_window_rule() result for the window
+        """
+        hwnd = plan.hwnd
 
-        # Step 2: Apply maximize / normal state
         # If skip_popups is set, check WS_POPUP style bit and suppress maximize for popups
-        effective_maximize = maximize
-        if maximize and skip_popups:
+        effective_maximize = plan.maximize
+        if plan.maximize and plan.skip_popups:
             try:
-                style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
+                style = _window_style(hwnd)
                 if style & win32con.WS_POPUP:
                     self.logger.info(
-                        f"Skipping maximize for '{window_title}' — WS_POPUP window and skip_popups=True"
+                        f"Skipping maximize for '{plan.title}' — WS_POPUP window and skip_popups=True"
                     )
                     effective_maximize = False
             except Exception as e:
                 self.logger.warning(f"Could not read window style for hwnd={hwnd}: {e}")
 
-        current_maximized = self.is_window_maximized(hwnd)
+        current_maximized = plan.current_maximized
+        if plan.needs_move and effective_maximize:
+            # The move restored the window; re-read the state (only the
+            # maximize branch looks at it after a move)
+            current_maximized = self.is_window_maximized(hwnd)
 
         if effective_maximize:
             if not current_maximized:
-                self.logger.info(f"Maximizing '{window_title}'")
-                self.maximize_window(hwnd, monitor)
-                operations.append("maximize")
+                self.logger.info(f"Maximizing '{plan.title}'")
+                self.maximize_window(hwnd, plan.monitor, plan.title)
+                plan.operations.append("maximize")
         else:
-            # Un-maximize if needed (already done by move_window if we moved)
-            if current_maximized and not needs_move:
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                operations.append("restore")
+            # Un-maximize if needed (already done by the move if we moved)
+            if current_maximized and not plan.needs_move:
+                self.refresh()
+                # Nothing here depends on the restore having finished, so post
+                # it rather than wait on the window's (possibly hung) thread
+                win32api.PostMessage(
+                    hwnd, win32con.WM_SYSCOMMAND, win32con.SC_RESTORE, 0
+                )
+                plan.operations.append("restore")
 
-        return {"changed": True, "operations": operations}
+        return {"changed": True, "operations": plan.operations}
+
+    def _run_per_window(self, fn, items):
+        """Call fn for each item, concurrently when there is more than one.
+
+        ShowWindow on another process's window waits for that window's
+        thread, so windows of different apps are handled in parallel rather
+        than one unresponsive app stalling all the others.
+
+        Args:
+            fn: Callable taking one item
+            items (list): Items to process; each must target a different window
+
+        Returns:
+            list: Per item, in order, fn's return value or the exception it raised
+        """
+
+        def call(item):
+            try:
+                return fn(item)
+            except Exception as e:
+                return e
+
+        if len(items) < 2:
+            return [call(item) for item in items]
+        return list(self._get_executor().map(call, items))
 
     def apply_rules_for_window(self, hwnd: int, layout_name: str, assignment: dict) -> dict:
         """Apply rules to a single window identified by hwnd.
@@ -691,10 +1382,6 @@ class WindowManager:
                 "message": "Window is minimized — skipping rule application",
             }
 
-        def _norm_exe(s: str) -> str:
-            s = (s or "").strip().lower()
-            return s if s.endswith(".exe") else (s + ".exe" if s else s)
-
         # Find the first matching rule for this window
         matched_rule = None
         for rule in rules:
@@ -757,12 +1444,49 @@ class WindowManager:
             ),
         }
 
-    def apply_rules(self, layout_name: str, assignment: dict):
+    def _index_windows(self, windows, reuse: bool):
+        """Build (or reuse) the rule-matching index for a window list.
+
+        The match keys (normalized exe, lowercased path and title) are derived
+        once per list. With reuse, the index is kept and passes over the same
+        list object (the service's cached snapshot) skip the rebuild.
+
+        Args:
+            windows: Window dicts, as passed to apply_rules (read-only)
+            reuse: The list is a long-lived snapshot that may be passed again;
+                False for a one-off list, which is then not kept alive
+
+        Returns:
+            tuple: (by_exe, by_process_path, title_list)
+        """
+        cached = self._rule_index
+        if reuse and cached is not None and cached[0] is windows:
+            return cached[1]
+
+        by_exe: dict[str, list] = {}
+        by_process_path: dict[str, list] = {}
+        title_list = []
+        for window in windows:
+            get = window.get
+            exe_key = _norm_exe(get("exe_name") or get("app_name"))
+            by_exe.setdefault(exe_key, []).append(window)
+            path_key = (get("process_path") or "").lower()
+            by_process_path.setdefault(path_key, []).append(window)
+            title_list.append(((get("title") or "").lower(), window))
+
+        index = (by_exe, by_process_path, title_list)
+        if reuse:
+            self._rule_index = (windows, index)
+        return index
+
+    def apply_rules(self, layout_name: str, assignment: dict, windows=None):
         """Apply window placement rules from the specified layout.
 
         Args:
             layout_name: Name of the layout whose rules to apply
             assignment:  Slot->identity_key mapping from the frontend
+            windows:     Current window list if the caller keeps one up to
+                         date (read-only); enumerated here when None
 
         Returns:
             dict: Summary of applied rules
@@ -802,8 +1526,11 @@ class WindowManager:
                 "details": [],
             }
 
-        # Get all windows
-        windows = self.get_all_windows()
+        # Get all windows; a caller-supplied list is a snapshot whose index
+        # can be reused, get_all_windows() returns a fresh copy every time
+        reuse_index = windows is not None
+        if windows is None:
+            windows = self.get_all_windows()
 
         # Track results
         results = {
@@ -814,6 +1541,14 @@ class WindowManager:
             "details": [],
         }
 
+        # hwnd -> (rule, window, target_monitor_id); a later rule matching the
+        # same window replaces the earlier one, as applying them in turn would
+        targets: dict[int, tuple] = {}
+
+        # Exe/path rules are dict lookups; only title rules (substring match)
+        # still scan every window
+        by_exe, by_process_path, title_list = self._index_windows(windows, reuse_index)
+
         # Apply each rule (no need to check "enabled" - layout active = all rules active)
         for rule in rules:
             target_monitor_id = rule.get("target_monitor_id")
@@ -832,34 +1567,22 @@ class WindowManager:
                 continue
 
             # Find matching windows
-            matching_windows = []
             match_type = rule.get("match_type")
             match_value = rule.get("match_value")
 
             mv = (match_value or "").strip()
             mv_lower = mv.lower()
 
-            def _norm_exe(s: str) -> str:
-                s = (s or "").strip().lower()
-                if s.endswith(".exe"):
-                    return s
-                return s + ".exe" if s else s
-
-            for window in windows:
-                if match_type == "exe":
-                    exe_name = (
-                        window.get("exe_name") or window.get("app_name") or ""
-                    ).strip()
-                    if _norm_exe(exe_name) == _norm_exe(mv_lower):
-                        matching_windows.append(window)
-                elif match_type == "window_title":
-                    title = (window.get("title") or "").lower()
-                    if mv_lower and mv_lower in title:
-                        matching_windows.append(window)
-                elif match_type == "process_path":
-                    process_path = (window.get("process_path") or "").lower()
-                    if mv_lower and mv_lower == process_path:
-                        matching_windows.append(window)
+            if match_type == "exe":
+                matching_windows = by_exe.get(_norm_exe(mv_lower), [])
+            elif match_type == "window_title" and mv_lower:
+                matching_windows = [
+                    window for title, window in title_list if mv_lower in title
+                ]
+            elif match_type == "process_path" and mv_lower:
+                matching_windows = by_process_path.get(mv_lower, [])
+            else:
+                matching_windows = []
 
             if not matching_windows:
                 self.logger.debug(
@@ -875,61 +1598,75 @@ class WindowManager:
                 )
                 continue
 
-            # Apply the rule to all matching windows
+            # Collect the rule's windows; they are applied together below
             for window in matching_windows:
-                try:
-                    # Only apply to windows that are currently not minimized.
-                    # This lets users temporarily opt-out by minimizing.
-                    if window.get("is_minimized"):
-                        self.logger.debug(
-                            f"Skipping minimized window: {window.get('title') or '(untitled)'}"
-                        )
-                        continue
+                # Only apply to windows that are currently not minimized.
+                # This lets users temporarily opt-out by minimizing.
+                if window.get("is_minimized"):
+                    self.logger.debug(
+                        f"Skipping minimized window: {window.get('title') or '(untitled)'}"
+                    )
+                    continue
 
-                    # Skip windows with empty titles (system windows, popups)
-                    window_title = window.get("title", "").strip()
-                    if not window_title:
-                        self.logger.debug(
-                            f"Skipping window with empty title (hwnd={window['hwnd']})"
-                        )
-                        continue
-
-                    # Skip "Program Manager" (Windows Desktop)
-                    if window_title == "Program Manager":
-                        self.logger.debug(f"Skipping Program Manager (Windows Desktop)")
-                        continue
-
-                    # Apply rule with smart state checking
-                    result = self.apply_window_rule(
-                        window["hwnd"],
-                        target_monitor_id,
-                        maximize=rule.get("maximize", False),
-                        skip_popups=rule.get("skip_popups", False),
+                # Skip windows with empty titles (system windows, popups)
+                window_title = window.get("title", "").strip()
+                if not window_title:
+                    self.logger.debug(
+                        f"Skipping window with empty title (hwnd={window['hwnd']})"
                     )
+                    continue
 
-                    if result["changed"]:
-                        results["applied"] += 1
-                        operations_str = ", ".join(result["operations"])
-                        self.logger.info(
-                            f"Applied rule to '{window['title']}': {operations_str}"
-                        )
-                    else:
-                        # Window already in correct state - just debug log
-                        self.logger.debug(
-                            f"Window '{window['title']}' already in correct state"
-                        )
+                # Skip "Program Manager" (Windows Desktop)
+                if window_title == "Program Manager":
+                    self.logger.debug(f"Skipping Program Manager (Windows Desktop)")
+                    continue
 
-                except Exception as e:
-                    self.logger.error(
-                        f"Error applying rule {rule['rule_id']} to window: {str(e)}"
+                previous = targets.get(window["hwnd"])
+                if previous is not None:
+                    self.logger.debug(
+                        f"Rule {rule['rule_id']} overrides rule "
+                        f"{previous[0]['rule_id']} for '{window_title}'"
                     )
-                    results["failed"] += 1
-                    results["details"].append(
-                        {
-                            "rule_id": rule["rule_id"],
-                            "result": "error",
-                            "message": str(e),
-                        }
+                targets[window["hwnd"]] = (rule, window, target_monitor_id)
+
+        # Apply all rules with smart state checking; moves are batched
+        outcomes = self._apply_window_rules(
+            [
+                (
+                    window["hwnd"],
+                    target_monitor_id,
+                    rule.get("maximize", False),
+                    rule.get("skip_popups", False),
+                )
+                for rule, window, target_monitor_id in targets.values()
+            ]
+        )
+
+        for (rule, window, _), result in zip(targets.values(), outcomes):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Error applying rule {rule['rule_id']} to window: {str(result)}"
+                )
+                results["failed"] += 1
+                results["details"].append(
+                    {
+                        "rule_id": rule["rule_id"],
+                        "result": "error",
+                        "message": str(result),
+                    }
+                )
+            elif result["changed"]:
+                results["applied"] += 1
+                # Only format the operations summary if it will be emitted
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(
+                        f"Applied rule to '{window['title']}': "
+                        f"{', '.join(result['operations'])}"
                     )
+            else:
+                # Window already in correct state - just debug log
+                self.logger.debug(
+                    f"Window '{window['title']}' already in correct state"
+                )
 
         return results
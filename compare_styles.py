@@ -7,21 +7,16 @@ print("NORMAL (whole screen): 0x{:08X}".format(normal))
 print("FULLSCREEN: 0x{:08X}".format(fullscreen))
 print()
 
-print("WS_CAPTION (0x00C00000):")
-print("  Normal:", bool(normal & win32con.WS_CAPTION))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_CAPTION))
-print()
-
-print("WS_THICKFRAME (0x00040000):")
-print("  Normal:", bool(normal & win32con.WS_THICKFRAME))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_THICKFRAME))
-print()
-
-print("WS_SYSMENU (0x00080000):")
-print("  Normal:", bool(normal & win32con.WS_SYSMENU))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_SYSMENU))
-print()
-
-print("WS_POPUP (0x80000000):")
-print("  Normal:", bool(normal & win32con.WS_POPUP))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_POPUP))
+styles = [("Normal", normal), ("Fullscreen", fullscreen)]
+flags = [
+    ("WS_CAPTION", win32con.WS_CAPTION),
+    ("WS_THICKFRAME", win32con.WS_THICKFRAME),
+    ("WS_SYSMENU", win32con.WS_SYSMENU),
+    ("WS_POPUP", win32con.WS_POPUP),
+]
+for i, (flag_name, flag) in enumerate(flags):
+    if i:
+        print()
+    print(f"{flag_name} (0x{flag & 0xFFFFFFFF:08X}):")
+    for label, style in styles:
+        print(f"  {label}:", bool(style & flag))
@@ -7,26 +7,19 @@ print("MAXIMIZED: 0x{:08X}".format(maximized))
 print("FULLSCREEN: 0x{:08X}".format(fullscreen))
 print()
 
-# Check important bits
-print("WS_CAPTION (0x00C00000):")
-print("  Maximized:", bool(maximized & win32con.WS_CAPTION))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_CAPTION))
-print()
-
-print("WS_THICKFRAME (0x00040000):")
-print("  Maximized:", bool(maximized & win32con.WS_THICKFRAME))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_THICKFRAME))
-print()
-
-print("WS_SYSMENU (0x00080000):")
-print("  Maximized:", bool(maximized & win32con.WS_SYSMENU))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_SYSMENU))
-print()
-
-print("WS_BORDER (0x00800000):")
-print("  Maximized:", bool(maximized & win32con.WS_BORDER))
-print("  Fullscreen:", bool(fullscreen & win32con.WS_BORDER))
-print()
+# Check important bits: one table-driven pass over (label, style) pairs
+styles = [("Maximized", maximized), ("Fullscreen", fullscreen)]
+flags = [
+    ("WS_CAPTION", win32con.WS_CAPTION),
+    ("WS_THICKFRAME", win32con.WS_THICKFRAME),
+    ("WS_SYSMENU", win32con.WS_SYSMENU),
+    ("WS_BORDER", win32con.WS_BORDER),
+]
+for flag_name, flag in flags:
+    print(f"{flag_name} (0x{flag & 0xFFFFFFFF:08X}):")
+    for label, style in styles:
+        print(f"  {label}:", bool(style & flag))
+    print()
 
 # XOR to see what changed
 diff = maximized ^ fullscreen
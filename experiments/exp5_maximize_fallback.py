@@ -6,20 +6,7 @@ import win32gui
 import win32con
 import time
 
-
-def get_vivaldi_window():
-    """Find Vivaldi window."""
-
-    def callback(hwnd, windows):
-        if win32gui.IsWindowVisible(hwnd):
-            title = win32gui.GetWindowText(hwnd)
-            if "Vivaldi" in title:
-                windows.append((hwnd, title))
-        return True
-
-    windows = []
-    win32gui.EnumWindows(callback, windows)
-    return windows[0] if windows else None
+from win32_helpers import get_vivaldi_window, get_window_style
 
 
 def main():
@@ -32,9 +19,7 @@ def main():
     print(f"Found: {title} (HWND: {hwnd})")
 
     # Get current style
-    style_before = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-    if style_before < 0:
-        style_before = style_before & 0xFFFFFFFF
+    style_before = get_window_style(hwnd)
     print(f"Style before: 0x{style_before:08X}")
 
     # Just maximize
@@ -43,9 +28,7 @@ def main():
 
     # Wait and check
     time.sleep(0.5)
-    style_after = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-    if style_after < 0:
-        style_after = style_after & 0xFFFFFFFF
+    style_after = get_window_style(hwnd)
     print(f"Style after: 0x{style_after:08X}")
 
     # Check window rect
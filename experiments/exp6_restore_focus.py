@@ -3,12 +3,13 @@ Experiment 6: SendInput but restore original focus afterward
 """
 
 import win32gui
-import win32con
 import win32api
 import time
 import ctypes
 from ctypes import wintypes
 
+from win32_helpers import get_vivaldi_window, get_window_style
+
 # Define INPUT structures
 PUL = ctypes.POINTER(ctypes.c_ulong)
 
@@ -50,35 +51,20 @@ class Input(ctypes.Structure):
     _fields_ = [("type", wintypes.DWORD), ("ii", Input_I)]
 
 
-def press_key(hexKeyCode):
-    extra = ctypes.c_ulong(0)
-    ii_ = Input_I()
-    ii_.ki = KeyBdInput(hexKeyCode, 0, 0, 0, ctypes.pointer(extra))
-    x = Input(ctypes.c_ulong(1), ii_)
-    ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
-
-
-def release_key(hexKeyCode):
-    extra = ctypes.c_ulong(0)
-    ii_ = Input_I()
-    ii_.ki = KeyBdInput(hexKeyCode, 0, 0x0002, 0, ctypes.pointer(extra))
-    x = Input(ctypes.c_ulong(1), ii_)
-    ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_SCANCODE = 0x0008
 
 
-def get_vivaldi_window():
-    """Find Vivaldi window."""
-
-    def callback(hwnd, windows):
-        if win32gui.IsWindowVisible(hwnd):
-            title = win32gui.GetWindowText(hwnd)
-            if "Vivaldi" in title:
-                windows.append((hwnd, title))
-        return True
-
-    windows = []
-    win32gui.EnumWindows(callback, windows)
-    return windows[0] if windows else None
+def tap_key(hexKeyCode):
+    """Press and release a key (as scan codes) in a single SendInput call."""
+    scan = ctypes.windll.user32.MapVirtualKeyW(hexKeyCode, 0)  # MAPVK_VK_TO_VSC
+    inputs = (Input * 2)()
+    inputs[0].type = inputs[1].type = 1  # INPUT_KEYBOARD
+    inputs[0].ii.ki = KeyBdInput(0, scan, KEYEVENTF_SCANCODE, 0, None)
+    inputs[1].ii.ki = KeyBdInput(
+        0, scan, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, 0, None
+    )
+    ctypes.windll.user32.SendInput(2, inputs, ctypes.sizeof(Input))
 
 
 def main():
@@ -98,9 +84,7 @@ def main():
     print(f"Original foreground: {original_title} (HWND: {original_foreground})")
 
     # Get current style
-    style_before = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-    if style_before < 0:
-        style_before = style_before & 0xFFFFFFFF
+    style_before = get_window_style(hwnd)
     print(f"Style before: 0x{style_before:08X}")
 
     # Make Vivaldi foreground
@@ -115,17 +99,13 @@ def main():
     # Send F11 using SendInput
     print("Sending F11 via SendInput...")
     VK_F11 = 0x7A
-    press_key(VK_F11)
-    time.sleep(0.05)
-    release_key(VK_F11)
+    tap_key(VK_F11)
 
     # Wait for fullscreen to apply
     time.sleep(0.3)
 
     # Check style
-    style_after = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-    if style_after < 0:
-        style_after = style_after & 0xFFFFFFFF
+    style_after = get_window_style(hwnd)
     print(f"Style after: 0x{style_after:08X}")
 
     if style_before != style_after:
@@ -0,0 +1,47 @@
+"""Win32 helpers shared by the experiment scripts and test_placement.py."""
+
+import ctypes
+from ctypes import wintypes
+
+import win32con
+
+_user32 = ctypes.windll.user32
+
+# Unsigned return type, so styles need no sign fix-up
+_user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+_user32.GetWindowLongW.restype = wintypes.DWORD
+
+# Top-level window walk for get_vivaldi_window
+GW_HWNDNEXT = 2
+_user32.GetTopWindow.argtypes = [wintypes.HWND]
+_user32.GetTopWindow.restype = wintypes.HWND
+_user32.GetWindow.argtypes = [wintypes.HWND, wintypes.UINT]
+_user32.GetWindow.restype = wintypes.HWND
+_user32.IsWindowVisible.argtypes = [wintypes.HWND]
+_user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+_user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+
+
+def get_window_style(hwnd):
+    """Return a window's GWL_STYLE as an unsigned 32-bit value."""
+    return _user32.GetWindowLongW(hwnd, win32con.GWL_STYLE)
+
+
+def get_vivaldi_window():
+    """Find Vivaldi window.
+
+    Walks the top-level windows in z-order (the order EnumWindows reports
+    them) and stops at the first match, without a Python callback per window.
+    """
+    buf = ctypes.create_unicode_buffer(256)
+    hwnd = _user32.GetTopWindow(None)
+    while hwnd:
+        length = _user32.IsWindowVisible(hwnd) and _user32.GetWindowTextLengthW(hwnd)
+        if length:
+            if length >= len(buf):
+                buf = ctypes.create_unicode_buffer(length + 1)
+            _user32.GetWindowTextW(hwnd, buf, len(buf))
+            if "Vivaldi" in buf.value:
+                return hwnd, buf.value
+        hwnd = _user32.GetWindow(hwnd, GW_HWNDNEXT)
+    return None
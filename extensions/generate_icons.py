@@ -1,20 +1,32 @@
 """Generate simple extension icons with 'S' letter."""
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw, ImageFont
 
 
+@lru_cache(maxsize=None)
+def _base_font():
+    """Parse arial.ttf once; None if it isn't available."""
+    try:
+        # Try common Windows fonts
+        return ImageFont.truetype("arial.ttf", 10)
+    except OSError:
+        return None
+
+
 def create_icon(size, output_path):
     """Create a simple icon with 'S' on colored background."""
     # Create image with blue background
     img = Image.new("RGB", (size, size), color="#4A90E2")
     draw = ImageDraw.Draw(img)
 
-    # Try to use a nice font, fall back to default if not available
-    try:
-        # Try common Windows fonts
-        font_size = int(size * 0.6)
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except:
+    # Try to use a nice font, fall back to default if not available. Each size
+    # is a variant of the already parsed face rather than a fresh file load.
+    base_font = _base_font()
+    if base_font is not None:
+        font = base_font.font_variant(size=int(size * 0.6))
+    else:
         # Fall back to default font
         font = ImageFont.load_default()
 
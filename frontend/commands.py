@@ -5,7 +5,7 @@ Provides a registry of fuzzy-findable commands (like /monitors)
 and their corresponding UI views.
 """
 
-from typing import Any, Callable, Optional, Dict, List
+from typing import Any, Callable, Optional, Dict, List, Tuple
 import logging
 
 logger = logging.getLogger("WindowSwitcher.Commands")
@@ -24,8 +24,54 @@ def _normalize_exe_name(exe_name: str) -> str:
     return s + ".exe" if s else s
 
 
+class _PreparedRules:
+    """Rules of a layout bucketed by match type, with normalized match values.
+
+    Exe and path rules are dicts keyed by the normalized value, so matching a
+    window is a lookup per type; only title rules (substring match) are
+    scanned. Each entry keeps its position in the layout so the first
+    matching rule still wins, as with a plain in-order scan.
+    """
+
+    __slots__ = ("exe_rules", "path_rules", "title_rules")
+
+    def __init__(self):
+        self.exe_rules: Dict[str, Tuple[int, Dict]] = {}
+        self.path_rules: Dict[str, Tuple[int, Dict]] = {}
+        self.title_rules: List[Tuple[str, int, Dict]] = []
+
+
+def _prepare_rules(rules: List[Dict]) -> _PreparedRules:
+    """Normalize rule match values once, ahead of matching many windows.
+
+    Args:
+        rules: List of rule dicts from layout
+
+    Returns:
+        The rules bucketed by match type: exe values normalized, titles and
+        paths lowercased. Empty title/path rules (which never match) and
+        unknown match types are dropped.
+    """
+    prepared = _PreparedRules()
+    for index, rule in enumerate(rules):
+        match_type = rule.get("match_type")
+        match_value_lower = (rule.get("match_value") or "").strip().lower()
+
+        if match_type == "exe":
+            key = _normalize_exe_name(match_value_lower)
+            prepared.exe_rules.setdefault(key, (index, rule))
+        elif not match_value_lower:
+            continue
+        elif match_type == "window_title":
+            prepared.title_rules.append((match_value_lower, index, rule))
+        elif match_type == "process_path":
+            prepared.path_rules.setdefault(match_value_lower, (index, rule))
+
+    return prepared
+
+
 def _find_matching_rule_for_window(
-    window_data: Dict, rules: List[Dict]
+    window_data: Dict, prepared_rules: _PreparedRules
 ) -> Optional[Dict]:
     """Find if any rule matches the given window.
 
@@ -34,37 +80,30 @@ def _find_matching_rule_for_window(
 
     Args:
         window_data: Window dict with exe_name, title, process_path
-        rules: List of rule dicts from layout
+        prepared_rules: Rules of the layout, as returned by _prepare_rules()
 
     Returns:
         First matching rule dict, or None if no match
     """
-    for rule in rules:
-        match_type = rule.get("match_type")
-        match_value = (rule.get("match_value") or "").strip()
-        match_value_lower = match_value.lower()
-
-        if match_type == "exe":
-            # Normalize and compare exe names
-            exe_name = (
-                window_data.get("exe_name") or window_data.get("app_name") or ""
-            ).strip()
-            if _normalize_exe_name(exe_name) == _normalize_exe_name(match_value_lower):
-                return rule
-
-        elif match_type == "window_title":
-            # Substring match (case-insensitive)
-            title = (window_data.get("title") or "").lower()
-            if match_value_lower and match_value_lower in title:
+    # Exact exe / path matches are lookups (case-insensitive)
+    exe_name = window_data.get("exe_name") or window_data.get("app_name")
+    best = prepared_rules.exe_rules.get(_normalize_exe_name(exe_name))
+    if prepared_rules.path_rules:
+        process_path = (window_data.get("process_path") or "").lower()
+        hit = prepared_rules.path_rules.get(process_path)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+
+    # Substring title match (case-insensitive), only for rules listed earlier
+    if prepared_rules.title_rules:
+        title = (window_data.get("title") or "").lower()
+        for value, index, rule in prepared_rules.title_rules:
+            if best is not None and index > best[0]:
+                break
+            if value in title:
                 return rule
 
-        elif match_type == "process_path":
-            # Exact path match (case-insensitive)
-            process_path = (window_data.get("process_path") or "").lower()
-            if match_value_lower and match_value_lower == process_path:
-                return rule
-
-    return None
+    return best[1] if best is not None else None
 
 
 class Command:
@@ -91,6 +130,10 @@ class Command:
         self.handler = handler
         self.category = category
 
+        # Lowercased once here; search_commands runs on every keystroke
+        self._name_lower = name.lower()
+        self._searchable = f"{name} {description}".lower()
+
     def get_label(self) -> str:
         """Get the display label for this command."""
         return f"/{self.name} - {self.description}"
@@ -146,12 +189,11 @@ class CommandRegistry:
         # Simple substring matching
         matches = []
         for cmd in self.commands.values():
-            searchable = f"{cmd.name} {cmd.description}".lower()
-            if query_lower in searchable:
+            if query_lower in cmd._searchable:
                 matches.append(cmd)
 
         # Sort by relevance (exact name match first, then by name)
-        matches.sort(key=lambda c: (c.name.lower() != query_lower, c.name.lower()))
+        matches.sort(key=lambda c: (c._name_lower != query_lower, c._name_lower))
 
         return matches
 
@@ -680,7 +722,8 @@ class WindowsView:
         if not self.active_layout or "data" not in self.active_layout:
             return windows_with_rules
 
-        rules = self.active_layout["data"].get("rules", [])
+        # Normalize the rule values once, not once per window
+        rules = _prepare_rules(self.active_layout["data"].get("rules", []))
 
         for window in self.windows:
             if _find_matching_rule_for_window(window, rules):
@@ -900,7 +943,7 @@ class WindowDetailsView:
         self.error_message = None
 
         if active_layout and "data" in active_layout:
-            rules = active_layout["data"].get("rules", [])
+            rules = _prepare_rules(active_layout["data"].get("rules", []))
             self.existing_rule = _find_matching_rule_for_window(window_data, rules)
 
             if self.existing_rule:
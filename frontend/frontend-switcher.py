@@ -1,3 +1,4 @@
+import atexit
 import ctypes
 import ctypes.wintypes
 import json
@@ -16,6 +17,7 @@ from .commands import (
     get_registry,
     register_builtin_commands,
     _find_matching_rule_for_window,
+    _prepare_rules,
     AssignView,
     MonitorManagementView,
     LayoutManagementView,
@@ -360,6 +362,34 @@ def fetch_windows() -> list[dict[str, Any]]:
     return []
 
 
+def register_switcher_window(hwnd: int) -> bool:
+    """Tell the backend to leave our own window out of the window list."""
+    try:
+        response = _http_session.post(
+            f"{TABS_API_URL}/switcher-window",
+            json={"hwnd": hwnd},
+            timeout=TABS_API_TIMEOUT,
+        )
+        return response.ok
+    except Exception as e:
+        logger.debug(f"Failed to register switcher window: {e}")
+        return False
+
+
+def unregister_switcher_window(hwnd: int) -> bool:
+    """Tell the backend our window is going away (undoes the registration)."""
+    try:
+        response = _http_session.delete(
+            f"{TABS_API_URL}/switcher-window",
+            json={"hwnd": hwnd},
+            timeout=TABS_API_TIMEOUT,
+        )
+        return response.ok
+    except Exception as e:
+        logger.debug(f"Failed to unregister switcher window: {e}")
+        return False
+
+
 def focus_window_with_retry(
     hwnd: int, max_attempts: int = 20, retry_delay_s: float = 0.05
 ) -> bool:
@@ -979,10 +1009,23 @@ def main() -> None:
         except Exception:
             current_mouse_pos = [0, 0]  # Fallback if mouse module unavailable
 
+        # Our own hwnd, registered with the backend so it is skipped by handle
+        try:
+            from raylib import ffi
+
+            switcher_hwnd = int(ffi.cast("uintptr_t", rl.GetWindowHandle()))
+        except Exception:
+            switcher_hwnd = 0
+        if switcher_hwnd:
+            atexit.register(unregister_switcher_window, switcher_hwnd)
+
         # Keep-alive thread to maintain HTTP connection
         def keep_connection_alive():
             """Periodically ping the API to keep connection alive."""
             while True:
+                # Re-registered on every ping: the backend may have restarted
+                if switcher_hwnd:
+                    register_switcher_window(switcher_hwnd)
                 try:
                     time.sleep(30)  # Ping every 30 seconds
                     _http_session.get(f"{TABS_API_URL}/status", timeout=1)
@@ -1026,6 +1069,8 @@ def main() -> None:
                         json={
                             "layout_name": layout_name_now,
                             "assignment": layout_assignment_now,
+                            # Backend skips the pass if nothing changed
+                            "only_if_changed": True,
                         },
                         timeout=15.0,  # rules can be slow (F11 + waits)
                     )
@@ -2006,9 +2051,11 @@ def main() -> None:
                                             else None
                                         )
                                         if selected_window:
-                                            rules = current_view.active_layout[
-                                                "data"
-                                            ].get("rules", [])
+                                            rules = _prepare_rules(
+                                                current_view.active_layout["data"].get(
+                                                    "rules", []
+                                                )
+                                            )
                                             existing_rule = (
                                                 _find_matching_rule_for_window(
                                                     selected_window, rules
@@ -3,17 +3,15 @@
 import win32gui
 import win32con
 
+from experiments.win32_helpers import get_window_style
+
 
 def get_foreground_window_info():
     hwnd = win32gui.GetForegroundWindow()
     title = win32gui.GetWindowText(hwnd)
     placement = win32gui.GetWindowPlacement(hwnd)
     rect = win32gui.GetWindowRect(hwnd)
-    style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-
-    # Convert to unsigned if negative
-    if style < 0:
-        style = style & 0xFFFFFFFF
+    style = get_window_style(hwnd)
 
     print(f"\nWindow: {title}")
     print(f"HWND: {hwnd}")